@@ -0,0 +1,52 @@
+"""并发异步推导输出
+
+在一个事件循环中同时运行大量 derive_stream，比较实际耗时与按节奏
+计算的理论耗时（节奏缩放为 scaled:0.05 以缩短测试时间）：
+
+    python benchmarks/async_streams.py [并发数]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_engine import Pacing, derive_stream, evaluate, get_backend, paced_chunks, result_steps  # noqa: E402
+
+STREAMS = 10_000
+PACE = Pacing.scaled(0.05)
+
+
+async def consume(expression):
+    """读完一个推导输出，返回输出块数"""
+    return sum([1 async for _ in derive_stream(expression, "So Big", PACE)])
+
+
+async def run(streams):
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(consume(f"{i % 9}+1") for i in range(streams)))
+    return time.perf_counter() - start, sum(counts)
+
+
+def main():
+    streams = int(sys.argv[1]) if len(sys.argv) > 1 else STREAMS
+    backend = get_backend("decimal")
+    paced = sum(delay for _, delay in paced_chunks(result_steps(evaluate("1+1", "So Big"), backend), PACE))
+
+    elapsed, chunks = asyncio.run(run(streams))
+    report = {
+        "streams": streams,
+        "chunks": chunks,
+        "paced_seconds": round(paced, 3),
+        "wall_seconds": round(elapsed, 3),
+        "overrun_ratio": round(elapsed / paced, 2),
+    }
+    print(json.dumps(report, indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""启动导入耗时检查
+
+使用 python -X importtime 测量各入口的导入耗时（多次运行取中位数），
+超出预算或加载了 PyQt5 / win10toast 时以非零退出码结束，可用于回归检查：
+
+    python benchmarks/import_time.py
+"""
+
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 各入口的导入代码与耗时预算（毫秒），约为实测中位数的两倍，留出机器波动的余量
+TARGETS = {
+    "Intelligence Calculator.py": (
+        "import importlib.util\n"
+        "spec = importlib.util.spec_from_file_location('intelligence_calculator', 'Intelligence Calculator.py')\n"
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))",
+        30,
+    ),
+    "calculator_cli": ("import calculator_cli", 25),
+    "calculator_engine": ("import calculator_engine", 10),
+    "calculator_core": ("import calculator_core", 25),
+}
+
+# 非图形界面入口不允许加载的模块
+FORBIDDEN = ("PyQt5", "win10toast")
+
+RUNS = 7
+
+
+def run_importtime(code):
+    """运行一次 -X importtime，返回 [(缩进层级, 模块名, 累计微秒)]"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # 表头
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), int(cumulative)))
+    return entries
+
+
+def measure(code, baseline):
+    """测量导入耗时（毫秒）和加载的全部模块"""
+    entries = run_importtime(code)
+    total = sum(us for depth, name, us in entries if depth == 0 and name not in baseline)
+    return total / 1000, {name for _, name, _ in entries}
+
+
+def main():
+    # 解释器启动时自带的导入不计入
+    baseline = {name for _, name, _ in run_importtime("pass")}
+
+    report = {}
+    failed = False
+    for target, (code, budget) in TARGETS.items():
+        samples = []
+        modules = set()
+        for _ in range(RUNS):
+            elapsed, modules = measure(code, baseline)
+            samples.append(elapsed)
+        median = statistics.median(samples)
+        forbidden = sorted(m for m in modules if m.split(".")[0] in FORBIDDEN)
+        ok = median <= budget and not forbidden
+        failed = failed or not ok
+        report[target] = {
+            "median_ms": round(median, 2),
+            "budget_ms": budget,
+            "forbidden_modules": forbidden,
+            "ok": ok,
+        }
+
+    print(json.dumps(report, ensure_ascii=False, indent=4))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
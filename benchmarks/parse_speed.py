@@ -0,0 +1,72 @@
+"""表达式解析速度
+
+分别测量 "a+b" 快速路径、带一元负号/科学计数法的连续加减，以及
+parse_operands（解析并由数值后端转换操作数）的每秒处理数：
+
+    python benchmarks/parse_speed.py
+
+每秒处理数与机器关系很大，因此同时在本机测量对同一批表达式只做一次
+正则 fullmatch（"a+b" 快速路径原来使用的正则）的速度作为参照。快速路径
+低于参照的 MIN_RATIO 倍时以非零退出码结束；提交之间的回归检查见
+benchmarks/suite.py --compare。
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calculator_engine  # noqa: E402
+from calculator_engine import parse, parse_operands  # noqa: E402
+
+COUNT = 1_000_000
+RUNS = 3
+
+# "a+b" 快速路径相对参照正则的最低速度比例
+MIN_RATIO = 0.5
+
+
+def rate(function, expressions, runs=RUNS):
+    """多次运行取最快一次的每秒处理数"""
+    best = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        for expression in expressions:
+            function(expression)
+        best = max(best, len(expressions) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    rng = random.Random(2026)
+    binary = [f"{rng.randint(0, 999)}{rng.choice('+-')}{rng.randint(0, 999)}" for _ in range(COUNT)]
+    chained = [f"-{rng.randint(0, 99)} + {rng.randint(1, 9)}e2 - -{rng.randint(0, 99)}" for _ in range(COUNT // 10)]
+
+    # 参照：已编译的 "a+b" 正则，只做匹配不构造语法树
+    # 两者交替测量、按每一轮的比例取最好一次，减少机器负载变化的影响
+    fullmatch = re.compile(calculator_engine._BINARY_PATTERN).fullmatch
+    reference = parse_binary = ratio = 0
+    for _ in range(RUNS):
+        reference_rate, parse_rate = rate(fullmatch, binary, 1), rate(parse, binary, 1)
+        reference, parse_binary = max(reference, reference_rate), max(parse_binary, parse_rate)
+        ratio = max(ratio, parse_rate / reference_rate)
+
+    report = {
+        "regex_fullmatch_per_s": round(reference),
+        "parse_binary_per_s": round(parse_binary),
+        "parse_binary_vs_regex": round(ratio, 3),
+        "min_ratio": MIN_RATIO,
+        "parse_chained_per_s": round(rate(parse, chained)),
+        "parse_operands_binary_per_s": round(rate(parse_operands, binary)),
+    }
+
+    print(json.dumps(report, indent=4))
+    return 0 if ratio >= MIN_RATIO else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
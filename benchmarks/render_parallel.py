@@ -0,0 +1,54 @@
+"""并行渲染推导文本的扩展性
+
+用 1、2、4 …… 直到 CPU 核数个进程渲染同一批表达式，输出耗时和相对
+单进程的加速比：
+
+    python benchmarks/render_parallel.py [表达式数]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_engine import render_batch  # noqa: E402
+
+COUNT = 200_000
+
+
+def worker_counts():
+    """1、2、4 …… 直到 CPU 核数"""
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    # 各不相同的连续加减，避免命中推导文本缓存
+    expressions = [f"{i} + {i % 997} - {i % 13}" for i in range(count)]
+
+    report = {"expressions": count, "cpu_count": os.cpu_count(), "runs": {}}
+    baseline = None
+    for workers in worker_counts():
+        sink = io.StringIO()
+        start = time.perf_counter()
+        for _ in render_batch(expressions, "So Big", "float", workers=workers, sink=sink):
+            pass
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        report["runs"][workers] = {"seconds": round(elapsed, 3), "speedup": round(baseline / elapsed, 2)}
+
+    print(json.dumps(report, indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""性能基准套件
+
+固定随机种子生成输入，每项重复多次取中位数，以 JSON 输出每秒处理数，
+便于在不同提交之间比较：
+
+    python benchmarks/suite.py --output baseline.json
+    python benchmarks/suite.py --compare baseline.json
+
+--compare 时任一项比基线慢超过 --tolerance（默认 20%）即以非零退出码结束。
+测量项：
+
+    parse          parse_operands（CalculationTask.run 中的解析）
+    calculate      解析、逐对检查权限并计算
+    can_calculate  UserManager.can_calculate
+    render         render_result（不经过缓存的推导文本生成）
+    play_instant   即时节奏下 play 输出全部推导步骤
+    user_roundtrip UserManager.save_user_info + load_user_info
+    append_text    CalculationDialog.append_text + 每帧 flush_text（offscreen Qt，
+                   未安装 PyQt5 时跳过）
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from calculator_engine import Pacing, _cached_transcript, calculate, compute_operands, parse_operands, \
+    play, render_result, result_steps  # noqa: E402
+from calculator_core import ThemeManager, UserManager  # noqa: E402
+
+SEED = 2026
+REPEATS = 5
+
+# 每次重复处理的数量（--quick 时缩小为十分之一）
+SIZES = {
+    "parse": 200_000,
+    "calculate": 100_000,
+    "can_calculate": 500_000,
+    "render": 20_000,
+    "play_instant": 20_000,
+    "user_roundtrip": 200,
+    "append_text": 20_000,
+}
+
+# append_text 测量中每帧追加的行数
+LINES_PER_FRAME = 50
+
+
+def make_expressions(rng, count):
+    """生成 "a+b" 与带负号 / 科学计数法的连续加减混合的表达式"""
+    expressions = []
+    for i in range(count):
+        if i % 4:
+            expressions.append(f"{rng.randint(0, 999)}{rng.choice('+-')}{rng.randint(0, 999)}")
+        else:
+            expressions.append(f"-{rng.randint(0, 99)} + {rng.randint(1, 9)}e2 - -{rng.randint(0, 99)}")
+    return expressions
+
+
+def user_manager(directory, level="So Big"):
+    """在临时目录中创建指定等级的 UserManager"""
+    manager = UserManager(ThemeManager(), os.path.join(directory, "user_info.json"))
+    manager.current_user["level"] = level
+    return manager
+
+
+def bench_parse(rng, count, directory):
+    expressions = make_expressions(rng, count)
+
+    def run():
+        for expression in expressions:
+            parse_operands(expression)
+    return run
+
+
+def bench_calculate(rng, count, directory):
+    expressions = make_expressions(rng, count)
+    can_calculate = user_manager(directory).can_calculate
+
+    def run():
+        for expression in expressions:
+            calculate(expression, can_calculate)
+    return run
+
+
+def bench_can_calculate(rng, count, directory):
+    can_calculate = user_manager(directory, "Max").can_calculate
+    pairs = [(rng.uniform(-2000, 2000), rng.uniform(-2000, 2000)) for _ in range(count)]
+
+    def run():
+        for a, b in pairs:
+            can_calculate(a, b, '+')
+    return run
+
+
+def bench_render(rng, count, directory):
+    results = [compute_operands(*parse_operands(f"{i}.5{rng.choice('+-')}{rng.randint(0, 999)}"))
+               for i in range(count)]
+
+    def run():
+        _cached_transcript.cache_clear()  # 测量实际渲染，而不是缓存命中
+        for result in results:
+            render_result(result)
+    return run
+
+
+def bench_play_instant(rng, count, directory):
+    results = [compute_operands(*parse_operands(f"{i}.25{rng.choice('+-')}{rng.randint(0, 999)}"))
+               for i in range(count)]
+    pacing = Pacing.instant()
+    sink = []
+
+    def run():
+        _cached_transcript.cache_clear()
+        for result in results:
+            play(result_steps(result), pacing, sink.append)
+        sink.clear()
+    return run
+
+
+def bench_user_roundtrip(rng, count, directory):
+    manager = user_manager(directory)
+
+    def run():
+        for _ in range(count):
+            manager.save_user_info()
+            manager.load_user_info()
+    return run
+
+
+def bench_append_text(rng, count, directory):
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt5.QtWidgets import QApplication
+        from calculator_gui import CalculationDialog
+    except ImportError:
+        return None
+
+    app = QApplication.instance() or QApplication([])
+    dialog = CalculationDialog()
+    dialog.show()
+    lines = [f"第 {i} 行 exp(iπ) = Σ[k=0→∞] (-1)^k π^{{2k}}/(2k)!\n" for i in range(count)]
+
+    def run():
+        for start in range(0, count, LINES_PER_FRAME):
+            for line in lines[start:start + LINES_PER_FRAME]:
+                dialog.append_text(line)
+            dialog.flush_text()  # 帧定时器到期
+            app.processEvents()
+        dialog.text_edit.clear()
+    return run
+
+
+BENCHMARKS = {
+    "parse": bench_parse,
+    "calculate": bench_calculate,
+    "can_calculate": bench_can_calculate,
+    "render": bench_render,
+    "play_instant": bench_play_instant,
+    "user_roundtrip": bench_user_roundtrip,
+    "append_text": bench_append_text,
+}
+
+
+def measure(run, count, repeats):
+    """运行 repeats 次，返回每秒处理数的中位数、最小值和最大值"""
+    run()  # 预热
+    rates = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        rates.append(count / (time.perf_counter() - start))
+    return {
+        "count": count,
+        "per_s": round(statistics.median(rates)),
+        "min_per_s": round(min(rates)),
+        "max_per_s": round(max(rates)),
+    }
+
+
+def git_commit():
+    """当前提交，不在 git 仓库中时返回 None"""
+    try:
+        proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def compare(results, baseline, tolerance):
+    """与基线比较，返回 {名称: 相对基线的速度比}，以及变慢超过 tolerance 的项目"""
+    ratios, regressions = {}, []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base or "per_s" not in base or "per_s" not in result:
+            continue
+        ratio = result["per_s"] / base["per_s"]
+        ratios[name] = round(ratio, 3)
+        if ratio < 1 - tolerance:
+            regressions.append(name)
+    return ratios, regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Intelligence Calculator 性能基准套件")
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"只运行指定项目（{' / '.join(BENCHMARKS)}）")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help=f"每项重复次数（默认 {REPEATS}）")
+    parser.add_argument("--quick", action="store_true", help="输入规模缩小为十分之一")
+    parser.add_argument("--output", metavar="FILE", help="同时把结果写入 JSON 文件（可作为基线）")
+    parser.add_argument("--compare", metavar="FILE", help="与基线 JSON 文件比较")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="允许的变慢比例（默认 0.2）")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"未知的项目: {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    names = args.names or list(BENCHMARKS)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": SEED,
+        "repeats": args.repeats,
+        "quick": args.quick,
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            count = SIZES[name] // 10 if args.quick else SIZES[name]
+            run = BENCHMARKS[name](random.Random(SEED), count, directory)
+            if run is None:
+                report["results"][name] = {"skipped": "未安装 PyQt5"}
+                continue
+            report["results"][name] = measure(run, count, args.repeats)
+
+    status = 0
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            ratios, regressions = compare(report["results"], json.load(f), args.tolerance)
+        report["compare"] = {"baseline": args.compare, "tolerance": args.tolerance,
+                             "ratios": ratios, "regressions": regressions}
+        status = 1 if regressions else 0
+
+    text = json.dumps(report, indent=4, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
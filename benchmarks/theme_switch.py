@@ -0,0 +1,119 @@
+"""主题切换耗时
+
+在 offscreen Qt 平台上创建主窗口，依次切换各个主题，测量每次
+MainWindow.apply_theme（含处理完事件）的耗时：先只有主窗口，再打开
+全部对话框（支付、赞助、VIP、结果、主题、计算过程）。打开全部对话框时
+超出预算则以非零退出码结束（未安装 PyQt5 时跳过）：
+
+    python benchmarks/theme_switch.py
+
+在临时目录中运行，不会修改 user_info.json。
+
+曾尝试改为应用级样式表加 "theme" 动态属性切换主题（只重新 polish 主窗口
+及其对话框），与一次 setStyleSheet 相比没有可测量的收益：每个控件的颜色
+都取决于主题，没有更小的"受影响控件"集合；耗时主要在 polish 和绘制上，
+解析样式表一次只需约 0.3 毫秒。QPalette 也无济于事：有样式表时调色板在
+polish 时确定，改调色板同样需要重新 polish。因此 apply_theme 仍然只调用
+一次缓存的 setStyleSheet，本脚本确认这一做法在打开全部对话框时仍在预算内。
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+ROUNDS = 20
+
+# 单次主题切换的预算（毫秒，取中位数）：只有主窗口 / 打开全部对话框
+BUDGET_MS = 5
+ALL_DIALOGS_BUDGET_MS = 50
+
+
+def measure(app, window):
+    """依次切换全部主题，返回切换耗时和重复应用同一主题的耗时（毫秒）"""
+    names = window.theme_manager.get_theme_names()
+    samples = []
+    for _ in range(ROUNDS):
+        for name in names:
+            window.theme_manager.set_theme(name)
+            start = time.perf_counter()
+            window.apply_theme()
+            app.processEvents()
+            samples.append((time.perf_counter() - start) * 1000)
+
+    # 重复应用当前主题（如等级变更回调中）
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        window.apply_theme()
+        app.processEvents()
+    reapply_ms = (time.perf_counter() - start) * 1000 / ROUNDS
+
+    return {
+        "switches": len(samples),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "reapply_ms": round(reapply_ms, 3),
+    }
+
+
+def main():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtWidgets import QApplication, QWidget
+    except ImportError:
+        print(json.dumps({"skipped": "未安装 PyQt5"}, ensure_ascii=False))
+        return 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        with open("user_info.json", "w", encoding="utf-8") as f:
+            json.dump({"level": "So Big", "expire_date": "2099-01-01 00:00:00",
+                       "join_date": "2026-01-01 00:00:00", "theme": "light"}, f)
+
+        import calculator_gui as gui
+
+        app = QApplication.instance() or QApplication([])
+        window = gui.MainWindow()
+        window.show()
+        app.processEvents()
+
+        report = {"main_window": measure(app, window)}
+
+        fonts = window.font_manager
+        dialogs = [
+            gui.PaymentDialog("Max", 50, fonts, window),
+            gui.SponsorDialog(fonts, window),
+            gui.VIPDialog(window.user_manager, fonts, window),
+            gui.ResultDialog("1.0 + 1.0", "2.0", fonts, window),
+            gui.ThemeDialog(window.user_manager, fonts, window),
+            gui.CalculationDialog(window),
+        ]
+        for dialog in dialogs:
+            dialog.show()
+        app.processEvents()
+
+        report["all_dialogs"] = measure(app, window)
+        report["widgets"] = len(window.findChildren(QWidget)) + 1
+
+        for dialog in dialogs:
+            dialog.close()
+        window.user_manager.flush()
+        window.close()
+        os.chdir(ROOT)
+
+    report["budget_ms"] = BUDGET_MS
+    report["all_dialogs_budget_ms"] = ALL_DIALOGS_BUDGET_MS
+    report["ok"] = (report["main_window"]["median_ms"] <= BUDGET_MS
+                    and report["all_dialogs"]["median_ms"] <= ALL_DIALOGS_BUDGET_MS)
+
+    print(json.dumps(report, indent=4))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""向量化批量计算速度
+
+测量 calculator_vector 对 1000 万行操作数做权限检查和加减运算的耗时
+（未安装 NumPy 时跳过）：
+
+    python benchmarks/vector_speed.py
+"""
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROWS = 10_000_000
+RUNS = 5
+
+
+def best_ms(function, *args):
+    """多次运行取最短耗时（毫秒）"""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        function(*args)
+        samples.append(time.perf_counter() - start)
+    return round(min(samples) * 1000, 1)
+
+
+def main():
+    try:
+        import numpy as np
+    except ImportError:
+        print(json.dumps({"skipped": "未安装 NumPy"}, ensure_ascii=False))
+        return 0
+
+    from calculator_vector import OPERATION_DTYPE, evaluate_arrays, evaluate_records
+
+    rng = np.random.default_rng(2026)
+    records = np.empty(ROWS, dtype=OPERATION_DTYPE)
+    records["a"] = rng.uniform(-2000, 2000, ROWS)
+    records["b"] = rng.uniform(-2000, 2000, ROWS)
+    records["op"] = np.where(rng.random(ROWS) < 0.5, b"+", b"-")
+    a, b, op = records["a"].copy(), records["b"].copy(), records["op"].copy()
+
+    report = {
+        "rows": ROWS,
+        "arrays_single_operator_ms": best_ms(evaluate_arrays, a, b, "+", "Max"),
+        "arrays_operator_column_ms": best_ms(evaluate_arrays, a, b, op, "Max"),
+        "records_ms": best_ms(evaluate_records, records, "Max"),
+    }
+    print(json.dumps(report, indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""Intelligence Calculator 结果缓存
+
+按 (数值后端, 规范化表达式) 缓存格式化后的算式、结果和完整推导文本：
+内存中是按条目数和总字符数限制大小的 LRU，可选的 SQLite 文件在重启后仍然有效。
+权限检查不经过缓存，每次查询都按当前用户重新检查：
+
+    cache = ResultCache(store=SQLiteStore(result_cache_path("user_info.json")))
+    entry = cache.calculate("1+1", user_manager.can_calculate, backend)
+    cache.stats()   -> CacheStats
+"""
+
+import os
+import time
+import zlib
+import threading
+from collections import OrderedDict, namedtuple
+
+from calculator_engine import PermissionDenied, check_operands, compute_operands, format_expression, \
+    get_backend, normalize, parse_operands, render_result
+
+
+# 缓存的计算结果（均为按数值后端格式化好的文本）
+CacheEntry = namedtuple("CacheEntry", ["expression", "result", "transcript"])
+
+# 缓存统计：内存命中、磁盘命中、未命中、内存淘汰次数和当前内存条目数
+CacheStats = namedtuple("CacheStats", ["hits", "disk_hits", "misses", "evictions", "size"])
+
+# 缓存文件名，与 user_info.json 放在同一目录
+CACHE_FILE = "result_cache.sqlite3"
+
+
+def result_cache_path(user_file):
+    """用户信息文件旁边的缓存文件路径"""
+    return os.path.join(os.path.dirname(os.path.abspath(user_file)), CACHE_FILE)
+
+
+class SQLiteStore:
+    """SQLite 持久化存储，超过 max_rows 时删除最久未使用的条目
+
+    每个条目记录最近一次写入或从磁盘读取的时间（used）。内存缓存命中的
+    查询不会访问磁盘，也就不更新 used。推导文本重复度很高，压缩后再写入。
+    """
+
+    def __init__(self, path, max_rows=100000):
+        import sqlite3
+
+        self.max_rows = max_rows
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "backend TEXT NOT NULL, expression TEXT NOT NULL, "
+            "display TEXT NOT NULL, result TEXT NOT NULL, transcript BLOB NOT NULL, "
+            "used REAL NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (backend, expression))"
+        )
+        # 旧版本的缓存文件没有 used 列，原有条目视为最久未使用
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(results)")}
+        if "used" not in columns:
+            self.connection.execute("ALTER TABLE results ADD COLUMN used REAL NOT NULL DEFAULT 0")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self.rows = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, key):
+        """读取条目并更新使用时间，不存在时返回 None"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT display, result, transcript FROM results WHERE backend = ? AND expression = ?", key
+            ).fetchone()
+            if row is not None:
+                self.connection.execute(
+                    "UPDATE results SET used = ? WHERE backend = ? AND expression = ?", (time.time(), *key)
+                )
+        if row is None:
+            return None
+        display, result, transcript = row
+        return CacheEntry(display, result, zlib.decompress(transcript).decode("utf-8"))
+
+    def put(self, key, entry):
+        """写入条目"""
+        transcript = zlib.compress(entry.transcript.encode("utf-8"), 1)
+        with self.lock:
+            cursor = self.connection.execute(
+                "INSERT OR REPLACE INTO results (backend, expression, display, result, transcript, used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, entry.expression, entry.result, transcript, time.time())
+            )
+            # 替换已有条目时 rowcount 也是 1，rows 只会偏大，超过上限时重新统计
+            self.rows += cursor.rowcount
+            if self.rows > self.max_rows:
+                self.rows = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if self.rows > self.max_rows:
+                # 一次删除十分之一，避免每次写入都要删除
+                excess = self.rows - self.max_rows + self.max_rows // 10
+                self.connection.execute(
+                    "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY used LIMIT ?)",
+                    (excess,)
+                )
+                self.rows = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self):
+        with self.lock:
+            self.connection.execute("DELETE FROM results")
+            self.rows = 0
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def _entry_chars(entry):
+    """条目在内存中占用的字符数"""
+    return len(entry.expression) + len(entry.result) + len(entry.transcript)
+
+
+class ResultCache:
+    """计算结果缓存：内存 LRU，可选持久化存储（如 SQLiteStore）
+
+    内存中最多保留 maxsize 个条目、共 max_chars 个字符；超大数的条目超过
+    max_chars 的 1/16 时只写入持久化存储，不放入内存。
+    """
+
+    def __init__(self, maxsize=4096, store=None, max_chars=16 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self.store = store
+        self.entries = OrderedDict()
+        self.chars = 0
+        self.lock = threading.Lock()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def calculate(self, expression, can_calculate, backend=None):
+        """解析、检查权限并返回 CacheEntry；未命中时计算、渲染推导文本并写入缓存
+
+        出错时与 calculate 一样抛出 CalculationError（无权限时为 PermissionDenied）。
+        """
+        backend = get_backend(backend)
+        operators, operands = parse_operands(expression, backend)
+
+        can_calc, msg = check_operands(can_calculate, operators, operands)
+        if not can_calc:
+            raise PermissionDenied(f"权限错误: {msg}")
+
+        key = (backend.key, normalize(expression))
+        entry = self.get(key)
+        if entry is None:
+            result = compute_operands(operators, operands, backend)
+            entry = CacheEntry(format_expression(result, backend), backend.format(result.value),
+                               render_result(result, backend))
+            self.put(key, entry)
+        return entry
+
+    def get(self, key):
+        """按键查找，先查内存再查持久化存储"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self.store.get(key) if self.store is not None else None
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        """写入内存，并写入持久化存储"""
+        with self.lock:
+            self._remember(key, entry)
+        if self.store is not None:
+            self.store.put(key, entry)
+
+    def _remember(self, key, entry):
+        """写入内存 LRU，超出条目数或字符数上限时淘汰最久未使用的条目（调用时需持有锁）"""
+        chars = _entry_chars(entry)
+        if chars > self.max_chars // 16:
+            return
+
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.chars -= _entry_chars(previous)
+        self.entries[key] = entry
+        self.chars += chars
+
+        while len(self.entries) > self.maxsize or self.chars > self.max_chars:
+            _, evicted = self.entries.popitem(last=False)
+            self.chars -= _entry_chars(evicted)
+            self.evictions += 1
+
+    def stats(self):
+        """返回 CacheStats"""
+        with self.lock:
+            return CacheStats(self.hits, self.disk_hits, self.misses, self.evictions, len(self.entries))
+
+    def clear(self):
+        """清空内存和持久化存储"""
+        with self.lock:
+            self.entries.clear()
+            self.chars = 0
+        if self.store is not None:
+            self.store.clear()
+
+    def close(self):
+        if self.store is not None:
+            self.store.close()
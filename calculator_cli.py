@@ -0,0 +1,197 @@
+"""Intelligence Calculator 命令行模式
+
+不依赖 PyQt5 和 win10toast，可在无图形界面的环境中运行：
+
+    python "Intelligence Calculator.py" --eval "5-3" --eval "1+2-3" --tier Max --pace instant
+    echo "1+1" | python "Intelligence Calculator.py" --stdin --derive
+    python "Intelligence Calculator.py" --add-stream a.txt b.txt --tier "So Big"
+"""
+
+import sys
+import argparse
+
+from calculator_engine import LEVELS, BACKENDS, CalculationError, DecimalBackend, Pacing, check_permission, \
+    calculate, format_expression, get_backend, iter_evaluate, play, render_batch, render_result, result_steps, \
+    stream_add
+
+
+# 出现以下任一参数时进入命令行模式
+CLI_FLAGS = ("--eval", "--stdin", "--add-stream")
+
+
+# 出现该参数时进入服务器模式
+SERVER_FLAG = "--serve"
+
+
+def _has_flag(argv, flag):
+    return any(arg == flag or arg.startswith(flag + "=") for arg in argv)
+
+
+def wants_cli(argv):
+    """判断命令行参数是否要求命令行模式"""
+    return any(_has_flag(argv, flag) for flag in CLI_FLAGS)
+
+
+def wants_server(argv):
+    """判断命令行参数是否要求服务器模式"""
+    return _has_flag(argv, SERVER_FLAG)
+
+
+def _job_count(text):
+    """--jobs 的参数类型：非负整数"""
+    try:
+        jobs = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的进程数: {text}")
+    if jobs < 0:
+        raise argparse.ArgumentTypeError("进程数不能为负数")
+    return jobs
+
+
+def _precision(text):
+    """--precision 的参数类型：正整数"""
+    try:
+        digits = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的有效位数: {text}")
+    if digits < 1:
+        raise argparse.ArgumentTypeError("有效位数必须大于 0")
+    return digits
+
+
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(
+        prog="Intelligence Calculator",
+        description="Intelligence Calculator 命令行模式"
+    )
+    parser.add_argument("--eval", action="append", default=[], metavar="EXPR",
+                        help="要计算的算式，可重复指定")
+    parser.add_argument("--stdin", action="store_true",
+                        help="从标准输入逐行读取算式")
+    parser.add_argument("--add-stream", nargs=2, metavar=("A", "B"),
+                        help="流式相加两个文件中的超大非负整数（- 表示标准输入），需要 So Big 版本")
+    parser.add_argument("--tier", choices=list(LEVELS), default="Plus",
+                        help="会员等级（默认 Plus）")
+    parser.add_argument("--pace", type=Pacing.parse, default=Pacing.instant(),
+                        help="推导输出节奏: instant / realtime / fast / scaled:倍数（默认 instant）")
+    parser.add_argument("--derive", action="store_true",
+                        help="同时输出推导过程")
+    parser.add_argument("--backend", choices=list(BACKENDS),
+                        help="数值后端（默认使用等级对应的后端，So Big 为 decimal）")
+    parser.add_argument("--precision", type=_precision, metavar="DIGITS",
+                        help="decimal 后端的有效位数（默认精确计算）")
+    parser.add_argument("--cache", nargs="?", const="", metavar="FILE",
+                        help="使用结果缓存，并保存到 SQLite 文件（默认为 user_info.json 旁边的缓存文件）")
+    parser.add_argument("--jobs", type=_job_count, default=1, metavar="N",
+                        help="--derive 且 --pace instant 时用 N 个进程并行渲染推导过程（0 表示 CPU 核数）")
+    return parser.parse_args(argv)
+
+
+def resolve_backend(args):
+    """根据命令行参数选择数值后端"""
+    if args.precision is not None:
+        if args.backend not in (None, "decimal"):
+            raise SystemExit("--precision 只能与 decimal 后端一起使用")
+        import decimal
+        return DecimalBackend(decimal.Context(prec=args.precision))
+    return get_backend(args.backend, args.tier)
+
+
+def read_expressions(args, stdin):
+    """按顺序产出待计算的算式"""
+    yield from args.eval
+    if args.stdin:
+        for line in stdin:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def open_cache(path):
+    """打开结果缓存（path 为空时使用默认位置）"""
+    from calculator_cache import ResultCache, SQLiteStore, result_cache_path
+    return ResultCache(store=SQLiteStore(path or result_cache_path("user_info.json")))
+
+
+def stream_derivation(expression, tier, pacing, backend, out):
+    """输出推导过程"""
+    result = calculate(expression, lambda a, b, operator: check_permission(tier, a, b), backend)
+
+    if pacing.factor == 0:
+        out.write(render_result(result, backend))
+    else:
+        def write(chunk):
+            out.write(chunk)
+            out.flush()
+
+        play(result_steps(result, backend), pacing, write)
+
+
+def main(argv=None, stdin=None, out=None, err=None):
+    """命令行入口，返回退出码（有算式失败时为 1）"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    stdin = sys.stdin if stdin is None else stdin
+    out = sys.stdout if out is None else out
+    err = sys.stderr if err is None else err
+
+    if args.add_stream:
+        sources = [stdin if path == "-" else path for path in args.add_stream]
+        if sources[0] is sources[1]:
+            err.write("--add-stream 只能有一个操作数来自标准输入\n")
+            return 1
+        try:
+            stream_add(sources[0], sources[1], out, args.tier)
+        except (CalculationError, OSError) as e:
+            err.write(f"{e}\n")
+            return 1
+        out.write("\n")
+        out.flush()
+        return 0
+
+    failed = False
+    backend = resolve_backend(args)
+    expressions = read_expressions(args, stdin)
+
+    if args.derive and args.pace.factor == 0 and args.jobs != 1:
+        # 推导文本不需要逐字输出，按顺序并行渲染
+        for transcript in render_batch(expressions, args.tier, backend, workers=args.jobs or None, sink=out):
+            if transcript.error:
+                err.write(f"{transcript.expression}: {transcript.error}\n")
+                failed = True
+    elif args.cache is not None and (not args.derive or args.pace.factor == 0):
+        # 重复的算式直接取缓存的结果和推导文本
+        cache = open_cache(args.cache)
+        can_calculate = lambda a, b, operator: check_permission(args.tier, a, b)
+        for expression in expressions:
+            try:
+                entry = cache.calculate(expression, can_calculate, backend)
+            except CalculationError as e:
+                err.write(f"{expression}: {e}\n")
+                failed = True
+                continue
+            out.write(entry.transcript if args.derive else f"{entry.expression} = {entry.result}\n")
+        cache.close()
+    elif args.derive:
+        for expression in expressions:
+            try:
+                stream_derivation(expression, args.tier, args.pace, backend, out)
+            except CalculationError as e:
+                err.write(f"{expression}: {e}\n")
+                failed = True
+            out.flush()
+    else:
+        format_number = backend.format
+        for item in iter_evaluate(expressions, args.tier, backend=backend):
+            if item.error:
+                err.write(f"{item.expression}: {item.error}\n")
+                failed = True
+            else:
+                out.write(f"{format_expression(item.result, backend)} = {format_number(item.result.value)}\n")
+
+    out.flush()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
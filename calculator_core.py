@@ -0,0 +1,566 @@
+"""Intelligence Calculator 主题与用户管理
+
+不依赖 PyQt5，命令行模式和后台任务也可以直接使用。
+"""
+
+import time
+from datetime import datetime
+
+from calculator_engine import LEVELS, check_permission, evaluate_batch, get_backend, render_batch
+from calculator_storage import DATE_FORMAT, DEFAULT_USER, SAVE_DELAY, JsonProfileStore, UserProfile, verify_profile
+
+# 每个会员月的秒数
+MONTH_SECONDS = 30 * 24 * 3600
+
+# 主窗口及各对话框的样式表模板，按主题颜色填充（见 ThemeManager.get_stylesheet）
+STYLESHEET_TEMPLATE = """
+    QMainWindow {{
+        background-color: {window_bg};
+    }}
+    QWidget {{
+        background-color: {window_bg};
+        color: {text_color};
+    }}
+    QLabel {{
+        color: {text_color};
+    }}
+    QLabel#main_title {{
+        color: {title_color};
+    }}
+    QLabel#version_info {{
+        color: #FF6B6B;
+    }}
+    QLabel#input_label {{
+        color: {text_color};
+    }}
+    QLabel#example_label {{
+        color: #666666;
+    }}
+    QLabel#expire_info {{
+        color: {text_color};
+    }}
+    QLabel#copyright_label {{
+        color: #999999;
+    }}
+    QLineEdit {{
+        background-color: {card_bg};
+        border: 1px solid {border_color};
+        border-radius: 5px;
+        padding: 8px;
+        color: {text_color};
+    }}
+    QPushButton {{
+        background-color: {button_bg};
+        color: white;
+        font-weight: bold;
+        border: none;
+        border-radius: 5px;
+        padding: 10px;
+    }}
+    QPushButton:hover {{
+        background-color: {button_hover};
+    }}
+    QPushButton:disabled {{
+        background-color: #CCCCCC;
+    }}
+    QPushButton#calculate_button {{
+        background-color: {button_bg};
+        color: white;
+        font-weight: bold;
+        border: none;
+        border-radius: 5px;
+        padding: 10px;
+    }}
+    QPushButton#calculate_button:hover {{
+        background-color: {button_hover};
+    }}
+    QTextEdit, QPlainTextEdit {{
+        background-color: {card_bg};
+        border: 1px solid {border_color};
+        color: {text_color};
+    }}
+    QDialog {{
+        background-color: {window_bg};
+    }}
+    
+    /* 支付对话框样式 */
+    QLabel#payment_title {{
+        font-size: 20px;
+        font-weight: bold;
+        color: {title_color};
+    }}
+    QLabel#payment_price {{
+        font-size: 18px;
+        font-weight: bold;
+        color: #FF6B6B;
+    }}
+    QLabel#payment_desc {{
+        font-size: 14px;
+        color: {text_color};
+    }}
+    QLabel#payment_platform_title {{
+        font-weight: bold;
+        font-size: 16px;
+        color: {text_color};
+    }}
+    QLabel#payment_hint {{
+        font-size: 12px;
+        color: #999;
+        font-style: italic;
+    }}
+    QPushButton#payment_button {{
+        background-color: #FF6B6B;
+        color: white;
+        font-weight: bold;
+        font-size: 16px;
+        border: none;
+        border-radius: 10px;
+        padding: 10px;
+    }}
+    QPushButton#payment_button:enabled {{
+        background-color: #4CAF50;
+    }}
+    QPushButton#payment_button:enabled:hover {{
+        background-color: #45a049;
+    }}
+    
+    /* 赞助对话框样式 */
+    QLabel#sponsor_title {{
+        font-size: 20px;
+        font-weight: bold;
+        color: {title_color};
+    }}
+    QLabel#sponsor_intro {{
+        font-size: 14px;
+        color: {text_color};
+        font-style: italic;
+    }}
+    QLabel#sponsor_desc {{
+        font-size: 14px;
+        color: {text_color};
+    }}
+    QLabel#sponsor_platform_title {{
+        font-weight: bold;
+        font-size: 16px;
+        color: {text_color};
+    }}
+    QPushButton#sponsor_button {{
+        background-color: #FF6B6B;
+        color: white;
+        font-weight: bold;
+        font-size: 16px;
+        border: none;
+        border-radius: 10px;
+        padding: 10px;
+    }}
+    QPushButton#sponsor_button:enabled {{
+        background-color: #4CAF50;
+    }}
+    QPushButton#sponsor_button:enabled:hover {{
+        background-color: #45a049;
+    }}
+    
+    /* VIP对话框样式 */
+    QLabel#vip_title {{
+        color: {title_color};
+    }}
+    QLabel#vip_status {{
+        color: {text_color};
+    }}
+    QLabel#vip_note {{
+        color: #FF6B6B;
+        font-style: italic;
+    }}
+    
+    /* 结果对话框样式 */
+    QLabel#result_text {{
+        color: #2E7D32;
+    }}
+    QLabel#result_info {{
+        color: {text_color};
+    }}
+    QPushButton#result_sponsor_button {{
+        background-color: {button_bg};
+        color: white;
+        font-weight: bold;
+        font-size: 14px;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 20px;
+    }}
+    QPushButton#result_sponsor_button:hover {{
+        background-color: {button_hover};
+    }}
+    
+    /* 主题对话框样式 */
+    QLabel#theme_title {{
+        color: {title_color};
+    }}
+    QLabel#theme_info {{
+        color: {text_color};
+    }}
+    QLabel#theme_note {{
+        color: #FF6B6B;
+        font-style: italic;
+    }}
+    QPushButton#theme_close_button {{
+        background-color: #9E9E9E;
+        color: white;
+        font-weight: bold;
+        border: none;
+        border-radius: 5px;
+        padding: 10px;
+    }}
+    QPushButton#theme_close_button:hover {{
+        background-color: #757575;
+    }}
+"""
+
+# 各等级 VIP 标签的样式（与主题无关）
+VIP_LABEL_STYLES = {
+    "So Big": """
+        QLabel {
+            background-color: #FFD700;
+            color: #000;
+            font-weight: bold;
+            border: 2px solid #FF6B00;
+            border-radius: 8px;
+            padding: 5px 20px;
+        }
+        QLabel:hover {
+            background-color: #FFED4E;
+        }
+    """,
+    "Ultra": """
+        QLabel {
+            background-color: #9C27B0;
+            color: white;
+            font-weight: bold;
+            border: 2px solid #7B1FA2;
+            border-radius: 8px;
+            padding: 5px 20px;
+        }
+        QLabel:hover {
+            background-color: #AB47BC;
+        }
+    """,
+    "Max": """
+        QLabel {
+            background-color: #2196F3;
+            color: white;
+            font-weight: bold;
+            border: 2px solid #1976D2;
+            border-radius: 8px;
+            padding: 5px 20px;
+        }
+        QLabel:hover {
+            background-color: #42A5F5;
+        }
+    """,
+    "Pro": """
+        QLabel {
+            background-color: #4CAF50;
+            color: white;
+            font-weight: bold;
+            border: 2px solid #388E3C;
+            border-radius: 8px;
+            padding: 5px 20px;
+        }
+        QLabel:hover {
+            background-color: #66BB6A;
+        }
+    """,
+    "Plus": """
+        QLabel {
+            background-color: #9E9E9E;
+            color: white;
+            font-weight: bold;
+            border: 2px solid #757575;
+            border-radius: 8px;
+            padding: 5px 20px;
+        }
+        QLabel:hover {
+            background-color: #BDBDBD;
+        }
+    """,
+}
+
+
+class ThemeManager:
+    """主题管理器"""
+    
+    def __init__(self):
+        self.current_theme = "light"
+        self.themes = {
+            "light": {
+                "window_bg": "#F5F5F5",
+                "card_bg": "#FFFFFF",
+                "text_color": "#333333",
+                "button_bg": "#0078D7",
+                "button_hover": "#005A9E",
+                "border_color": "#E0E0E0",
+                "title_color": "#0078D7",  # 标题蓝色
+                "icon_color": "#333333"  # 图标颜色
+            },
+            "dark": {
+                "window_bg": "#1E1E1E",
+                "card_bg": "#2D2D30",
+                "text_color": "#FFFFFF",
+                "button_bg": "#0E639C",
+                "button_hover": "#1177BB",
+                "border_color": "#3E3E42",
+                "title_color": "#0E639C",  # 暗蓝色
+                "icon_color": "#FFFFFF"  # 白色图标
+            },
+            "morandi": {
+                "window_bg": "#F5F0EB",
+                "card_bg": "#FFFFFF",
+                "text_color": "#5C534E",
+                "button_bg": "#D8C4B6",
+                "button_hover": "#C9B2A3",
+                "border_color": "#E5DCD5",
+                "title_color": "#8B7D6B",  # 莫兰迪色系
+                "icon_color": "#5C534E"  # 莫兰迪色
+            },
+            "golden": {
+                "window_bg": "#0A0A0A",
+                "card_bg": "#1A1A1A",
+                "text_color": "#FFD700",
+                "button_bg": "#D4AF37",
+                "button_hover": "#C19C30",
+                "border_color": "#333333",
+                "title_color": "#FFD700",  # 金色
+                "icon_color": "#FFD700",  # 金色图标
+                "gold_light": "#FFE066",  # 金色亮色（修正无效颜色码）
+                "gold_dark": "#CC9900"  # 金色暗色（修正无效颜色码）
+            }
+        }
+        
+        # 已生成的样式表，按主题名缓存
+        self.stylesheets = {}
+    
+    def set_theme(self, theme_name):
+        """设置主题"""
+        if theme_name in self.themes:
+            self.current_theme = theme_name
+            return True
+        return False
+    
+    def get_current_theme(self):
+        """获取当前主题"""
+        return self.themes.get(self.current_theme, self.themes["light"])
+    
+    def get_theme_names(self):
+        """获取所有主题名称"""
+        return list(self.themes.keys())
+    
+    def get_title_color(self):
+        """获取当前主题的标题颜色"""
+        theme = self.get_current_theme()
+        return theme.get("title_color", "#0078D7")
+    
+    def get_stylesheet(self, theme_name=None):
+        """获取主题（默认为当前主题）的样式表，每个主题只生成一次"""
+        if theme_name is None:
+            theme_name = self.current_theme
+        if theme_name not in self.themes:
+            theme_name = "light"
+        
+        stylesheet = self.stylesheets.get(theme_name)
+        if stylesheet is None:
+            theme = self.themes[theme_name]
+            stylesheet = STYLESHEET_TEMPLATE.format(**{"title_color": "#0078D7", **theme})
+            self.stylesheets[theme_name] = stylesheet
+        return stylesheet
+    
+    def get_vip_label_style(self, level):
+        """获取等级对应的 VIP 标签样式"""
+        return VIP_LABEL_STYLES.get(level, VIP_LABEL_STYLES["Plus"])
+
+
+class UserManager:
+    """用户管理类，处理用户级别和权限
+    
+    用户信息默认保存在 user_file（JSON）中；传入 store（如 SQLiteProfileStore）
+    时改为读写其中 user_id 对应的用户。
+    """
+    
+    def __init__(self, theme_manager, user_file="user_info.json", save_delay=SAVE_DELAY,
+                 store=None, user_id=DEFAULT_USER):
+        self.theme_manager = theme_manager
+        self.on_level_changed = None  # 等级变更回调
+        
+        # JSON 文件的保存操作合并后在后台线程中原子写入
+        self.store = store if store is not None else JsonProfileStore(user_file, save_delay)
+        self.user_file = self.store.path
+        self.user_id = user_id
+        
+        # 等级配置由计算引擎统一维护
+        self.levels = LEVELS
+        self.current_user = self.load_user_info()
+    
+    def load_user_info(self):
+        """从存储中加载用户信息（先写入尚未写入的修改，并检查内容），返回 UserProfile"""
+        default_info = UserProfile(join_date=datetime.now().strftime(DATE_FORMAT))
+        
+        try:
+            data = self.store.load(self.user_id)
+            if data is None:
+                # 创建默认用户信息
+                self.save_user_info(default_info)
+                return default_info
+            data, problems = verify_profile(data, self.levels)
+        except Exception as e:
+            print(f"加载用户信息失败: {e}")
+            return default_info
+        
+        for problem in problems:
+            print(f"用户信息已修正: {problem}")
+        
+        # 到期时间只在这里解析一次
+        profile = UserProfile.from_dict(data)
+        
+        # 检查是否过期
+        if profile.expired():
+            self.expire_profile(profile)
+            problems.append("会员已过期")
+        
+        if problems:
+            self.save_user_info(profile)
+        
+        # 设置主题
+        self.theme_manager.set_theme(profile.theme)
+        
+        return profile
+    
+    def expire_profile(self, profile):
+        """会员到期：恢复免费版及其可用的主题"""
+        profile.level = "Plus"
+        profile.expire_at = None
+        if profile.theme not in self.levels["Plus"]["theme_access"]:
+            profile.theme = "light"
+    
+    def save_user_info(self, user_info=None, fields=None):
+        """保存用户信息（fields 为要更新的字段，None 表示全部字段）"""
+        if user_info is None:
+            user_info = self.current_user
+        
+        try:
+            self.store.save(self.user_id, user_info.to_dict(), fields)
+            
+            # 触发等级变更回调
+            if self.on_level_changed:
+                self.on_level_changed(user_info.get("level", "Plus"))
+            
+            return True
+        except Exception as e:
+            print(f"保存用户信息失败: {e}")
+            return False
+    
+    def flush(self):
+        """立即写入尚未写入的修改，返回是否成功"""
+        return self.store.flush()
+    
+    def get_current_level(self):
+        """获取当前用户级别"""
+        return self.current_user.level
+    
+    def upgrade_user(self, level, months=1):
+        """升级用户级别"""
+        if level not in self.levels:
+            return False
+        
+        # 更新用户信息，保存失败时恢复
+        profile = self.current_user
+        previous = profile.level, profile.expire_at
+        profile.level = level
+        if level == "Plus":
+            profile.expire_at = None
+        else:
+            # 文件中的到期时间精确到秒
+            profile.expire_at = float(round(time.time()) + MONTH_SECONDS * months)
+        
+        # 等级和到期时间在同一事务中保存
+        if self.save_user_info(fields=("level", "expire_date")):
+            return True
+        profile.level, profile.expire_at = previous
+        return False
+    
+    def can_calculate(self, a, b, operator):
+        """检查用户是否有权限进行计算"""
+        return check_permission(self.get_current_level(), a, b, self.levels)
+    
+    def get_number_backend(self):
+        """获取当前等级使用的数值后端"""
+        return get_backend(self.levels[self.get_current_level()].get("backend"))
+    
+    def get_level_info(self, level):
+        """获取级别信息"""
+        if level in self.levels:
+            info = self.levels[level].copy()
+            info["name"] = level
+            return info
+        return None
+    
+    def get_all_levels(self):
+        """获取所有级别信息"""
+        return self.levels
+    
+    def get_expire_days(self):
+        """获取剩余天数"""
+        seconds_left = self.current_user.seconds_left()
+        if seconds_left is None:
+            return None
+        return max(0, int(seconds_left // 86400))
+    
+    def expire_in(self):
+        """距离会员到期的秒数（已过期时为 0），没有到期时间时返回 None"""
+        seconds_left = self.current_user.seconds_left()
+        return None if seconds_left is None else max(0.0, seconds_left)
+    
+    def check_expiry(self):
+        """会员已到期时降级为免费版并保存，返回是否降级"""
+        if not self.current_user.expired():
+            return False
+        self.expire_profile(self.current_user)
+        self.theme_manager.set_theme(self.current_user.theme)
+        self.save_user_info()
+        return True
+    
+    def check_expire_soon(self):
+        """检查是否即将过期（7天内）"""
+        days_left = self.get_expire_days()
+        if days_left is not None and days_left <= 7:
+            return True
+        return False
+    
+    def set_theme(self, theme_name):
+        """设置主题"""
+        level = self.get_current_level()
+        if theme_name in self.levels[level]["theme_access"]:
+            self.current_user.theme = theme_name
+            self.theme_manager.set_theme(theme_name)
+            self.save_user_info(fields=("theme",))
+            return True
+        else:
+            return False
+    
+    def can_use_theme(self, theme_name):
+        """检查用户是否有权限使用该主题"""
+        level = self.get_current_level()
+        return theme_name in self.levels[level]["theme_access"]
+
+
+def calculate_batch(expressions, user_manager):
+    """批量计算表达式（不创建线程和对话框，也不模拟缓慢输出）
+    
+    返回 BatchResult 列表，包含每个表达式的结果、权限判定和错误信息
+    """
+    return evaluate_batch(expressions, can_calculate=user_manager.can_calculate,
+                          backend=user_manager.get_number_backend())
+
+
+def render_transcripts(expressions, user_manager, workers=None, ordered=True, sink=None):
+    """按用户当前等级用多个进程渲染推导文本，逐个产出 Transcript（参数见 render_batch）"""
+    return render_batch(expressions, user_manager.get_current_level(), user_manager.get_number_backend(),
+                        user_manager.levels, workers=workers, ordered=ordered, sink=sink)
@@ -0,0 +1,1145 @@
+"""Intelligence Calculator 计算引擎
+
+纯 Python 实现，不依赖 PyQt5，可在后台任务中直接调用：
+
+    parse("1+2-3")            -> 语法树
+    evaluate("1+1", "Plus")   -> Result
+    derive("1+1")             -> 推导步骤迭代器
+    derive_stream("1+1")      -> 异步推导输出块（async for）
+
+数值计算由可替换的数值后端完成（float / fraction / decimal），
+So Big 等级默认使用不限精度的 decimal 后端；数百万位的超大整数
+可用 stream_add 以流式方式相加。
+
+界面中的 CalculationThread 只是对本模块的一层薄封装。
+"""
+
+import os
+import sys
+import math
+import time
+import threading
+from collections import deque, namedtuple
+from functools import lru_cache
+from itertools import islice
+
+
+# 会员等级配置（统一使用带空格的"So Big"作为键名），backend 为默认数值后端
+LEVELS = {
+    "Plus": {"price": 0, "max_number": 10, "theme_access": ["light"], "description": "基础版", "backend": "float"},
+    "Pro": {"price": 24, "max_number": 100, "theme_access": ["light"], "description": "专业版", "backend": "float"},
+    "Max": {"price": 50, "max_number": 1000, "theme_access": ["light"], "description": "增强版", "backend": "float"},
+    "Ultra": {"price": 100, "max_number": 1000, "theme_access": ["light", "dark", "morandi"], "description": "高级版", "backend": "float"},
+    "So Big": {"price": 200, "max_number": float('inf'), "theme_access": ["light", "dark", "morandi", "golden"], "description": "至尊版", "backend": "decimal"}
+}
+
+# 界面刷新间隔（秒），输出块按帧合并
+FRAME_INTERVAL = 0.016
+
+# 并行渲染推导文本时每个任务包含的表达式数
+RENDER_CHUNK_SIZE = 256
+
+# 两个操作数文本的总长度超过该值时不缓存推导文本，
+# 缓存占用的内存因此不超过约 4096 × 6KB
+TRANSCRIPT_CACHE_MAX_CHARS = 256
+
+# 推导中的一行输出，pause 为输出该行后的停顿秒数
+Step = namedtuple("Step", ["text", "pause"])
+
+# 表达式语法树：数字（保留原始文本）、一元负号、二元加减（左结合）
+Number = namedtuple("Number", ["text"])
+Negate = namedtuple("Negate", ["operand"])
+BinaryOp = namedtuple("BinaryOp", ["operator", "left", "right"])
+
+# 解析时直接用 tuple.__new__ 构造语法树节点，省去 namedtuple 构造函数的一层 Python 调用
+_tuple_new = tuple.__new__
+
+# 一次二元运算：a operator b = value
+Operation = namedtuple("Operation", ["operator", "a", "b", "value"])
+
+# 计算结果：operands 为各操作数（已计入一元负号），operations 为依次执行的二元运算
+Result = namedtuple("Result", ["operands", "operations", "value"])
+
+# 批量计算中单个表达式的结果：allowed 为权限判定（解析失败时为 None），error 为错误信息
+BatchResult = namedtuple("BatchResult", ["expression", "result", "allowed", "error"])
+
+# 推导文本：index 为表达式在批量输入中的序号，出错时 text 为 None
+Transcript = namedtuple("Transcript", ["index", "expression", "text", "error"])
+
+
+class CalculationError(Exception):
+    """计算错误，异常信息即显示给用户的提示"""
+
+
+class PermissionDenied(CalculationError):
+    """当前等级无权进行该计算"""
+
+
+class CalculationCancelled(CalculationError):
+    """计算已被取消"""
+
+
+class CancellationToken:
+    """协作式取消标记
+
+    推导过程在每一块输出前检查标记，等待也通过 sleep 进行，
+    调用 cancel() 后正在进行的等待会立即结束。
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def sleep(self, seconds):
+        """等待指定秒数，期间被取消时立即抛出 CalculationCancelled"""
+        if self._event.wait(seconds):
+            raise CalculationCancelled("计算已取消")
+
+    def check(self):
+        """已被取消时抛出 CalculationCancelled"""
+        if self._event.is_set():
+            raise CalculationCancelled("计算已取消")
+
+
+class Pacing:
+    """输出节奏：控制逐字输出的间隔以及推导步骤之间的停顿
+
+    instant  - 不等待，推导过程一次性输出
+    realtime - 打字机效果（每个字符 30ms，步骤间停顿 0.5~1 秒）
+    scaled   - 按倍数缩放 realtime 的所有等待时间
+    """
+
+    CHAR_DELAY = 0.03
+
+    # 最大倍数：realtime 推导约 30 秒，放慢 10 倍已足够观看
+    MAX_FACTOR = 10
+
+    # 界面中可选的预设节奏
+    PRESETS = {
+        "realtime": "实时",
+        "fast": "快速",
+        "instant": "即时",
+    }
+
+    def __init__(self, factor=1.0):
+        if not math.isfinite(factor):
+            raise ValueError("节奏倍数必须是有限数")
+        if factor < 0:
+            raise ValueError("节奏倍数不能为负数")
+        if factor > self.MAX_FACTOR:
+            raise ValueError(f"节奏倍数不能超过 {self.MAX_FACTOR}")
+        self.factor = factor
+
+    @classmethod
+    def instant(cls):
+        """即时输出"""
+        return cls(0)
+
+    @classmethod
+    def realtime(cls):
+        """打字机效果（默认）"""
+        return cls(1)
+
+    @classmethod
+    def scaled(cls, factor):
+        """按倍数缩放等待时间，factor < 1 时更快"""
+        return cls(factor)
+
+    @classmethod
+    def parse(cls, text):
+        """从字符串解析节奏：instant / realtime / fast / scaled:0.5 / 0.5"""
+        text = text.strip().lower()
+        if text == "instant":
+            return cls.instant()
+        if text == "realtime":
+            return cls.realtime()
+        if text == "fast":
+            return cls.scaled(0.25)
+        if text.startswith("scaled:"):
+            text = text[len("scaled:"):]
+        try:
+            factor = float(text)
+        except ValueError:
+            raise ValueError(f"无效的输出节奏: {text}")
+        return cls.scaled(factor)
+
+    @property
+    def name(self):
+        """节奏名称"""
+        if self.factor == 0:
+            return "instant"
+        if self.factor == 1:
+            return "realtime"
+        if self.factor == 0.25:
+            return "fast"
+        return f"scaled:{self.factor:g}"
+
+    @property
+    def char_delay(self):
+        """每个字符的输出间隔（秒）"""
+        return self.CHAR_DELAY * self.factor
+
+    def pause(self, seconds):
+        """步骤之间的停顿（秒）"""
+        return seconds * self.factor
+
+    def __eq__(self, other):
+        return isinstance(other, Pacing) and self.factor == other.factor
+
+    def __hash__(self):
+        return hash(self.factor)
+
+    def __repr__(self):
+        return f"Pacing({self.name})"
+
+
+class FloatBackend:
+    """浮点数后端（双精度，速度最快）"""
+
+    name = "float"
+    key = name  # 缓存键：计算结果相同的后端共用
+
+    def parse(self, text):
+        """解析数字，无效或不是有限数（inf、nan）时抛出 ValueError"""
+        value = float(text)
+        if not math.isfinite(value):
+            raise ValueError(f"无效的数字: {text}")
+        return value
+
+    def add(self, a, b):
+        return a + b
+
+    def subtract(self, a, b):
+        return a - b
+
+    def negate(self, value):
+        return -value
+
+    def format(self, value):
+        return str(value)
+
+
+class FractionBackend:
+    """精确有理数后端：整数保持整数，小数按分数精确计算"""
+
+    name = "fraction"
+    key = name
+
+    # 数字允许的最大位数（科学计数法按尾数位数 + 指数计），1e1000000 约需 0.3 秒
+    MAX_DIGITS = 10 ** 6
+
+    def __init__(self):
+        # 按需导入，避免拖慢启动
+        import decimal
+        from fractions import Fraction
+        self.fraction = Fraction
+        self.decimal = decimal.Decimal
+        # 整数与字符串互转超过 sys.get_int_max_str_digits() 位时会报错，
+        # 更长的数字改由 decimal 转换（不受该限制）
+        self.context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN,
+                                       traps=[decimal.InvalidOperation])
+        self.decimal_error = decimal.DecimalException
+
+    def parse(self, text):
+        """解析数字（支持 1.5、1e3、3/4），无效时抛出 ValueError
+
+        Fraction 会把 1e999999999 展开成完整的整数，因此先按文本估算位数，
+        超过 MAX_DIGITS 时抛出 CalculationError，不构造该数字。超过整数
+        字符串转换位数限制（默认 4300 位）的数字由 decimal 解析。
+        """
+        mantissa, _, exponent = text.lower().partition("e")
+        if exponent:
+            try:
+                digits = len(mantissa) + abs(int(exponent))
+            except ValueError:
+                raise ValueError(f"无效的数字: {text}")
+            if digits > self.MAX_DIGITS:
+                raise CalculationError("错误：数字位数超出范围")
+        elif len(text) > self.MAX_DIGITS:
+            raise CalculationError("错误：数字位数超出范围")
+        try:
+            return self.fraction(text)
+        except ZeroDivisionError:
+            raise ValueError(f"无效的数字: {text}")
+        except ValueError:
+            return self._parse_long(text)
+
+    def _parse_long(self, text):
+        """按十进制解析超过整数字符串转换位数限制的数字（支持 p/q），无效时抛出 ValueError"""
+        numerator, slash, denominator = text.partition("/")
+        try:
+            value = self.fraction(*self.context.create_decimal(numerator.strip()).as_integer_ratio())
+            if slash:
+                value /= self.fraction(*self.context.create_decimal(denominator.strip()).as_integer_ratio())
+        except (self.decimal_error, ValueError, OverflowError, ZeroDivisionError):
+            raise ValueError(f"无效的数字: {text}")
+        return value
+
+    def add(self, a, b):
+        return a + b
+
+    def subtract(self, a, b):
+        return a - b
+
+    def negate(self, value):
+        return -value
+
+    def format(self, value):
+        """整数按整数显示，有限小数按小数显示，其余按 p/q 显示"""
+        numerator, denominator = value.numerator, value.denominator
+        if denominator == 1:
+            return self._int_text(numerator)
+
+        # 分母只含因子 2 和 5 时是有限小数
+        rest, twos, fives = denominator, 0, 0
+        while rest % 2 == 0:
+            rest //= 2
+            twos += 1
+        while rest % 5 == 0:
+            rest //= 5
+            fives += 1
+        if rest != 1:
+            return f"{self._int_text(numerator)}/{self._int_text(denominator)}"
+
+        places = max(twos, fives)
+        digits = self._int_text(abs(numerator) * 10 ** places // denominator).rjust(places + 1, "0")
+        sign = "-" if numerator < 0 else ""
+        return f"{sign}{digits[:-places]}.{digits[-places:]}"
+
+    def _int_text(self, value):
+        """整数的十进制文本，超过整数字符串转换的位数限制时经由 decimal 转换"""
+        try:
+            return str(value)
+        except ValueError:
+            return str(self.decimal(value))
+
+
+class DecimalBackend:
+    """十进制后端
+
+    默认上下文保留 EXACT_DIGITS 位有效数字，并在需要舍入时报错，
+    因此加减法结果总是精确的；解析、格式化和加法的耗时都与位数成
+    线性关系，适合上千位的操作数。也可以传入自定义的 decimal.Context
+    控制精度和舍入方式。
+    """
+
+    name = "decimal"
+
+    # 精确计算允许的最大有效位数
+    EXACT_DIGITS = 10 ** 7
+
+    def __init__(self, context=None):
+        import decimal
+        if context is None:
+            context = decimal.Context(
+                prec=self.EXACT_DIGITS, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN,
+                traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow, decimal.Inexact]
+            )
+        self.context = context
+        self.decimal_error = decimal.DecimalException
+
+        # 自定义上下文的精度和舍入方式不同，计算结果也不同
+        if context.prec == self.EXACT_DIGITS and context.traps[decimal.Inexact]:
+            self.key = self.name
+        else:
+            self.key = f"{self.name}:{context.prec}:{context.rounding}:{context.Emin}:{context.Emax}"
+
+    def parse(self, text):
+        """解析数字（按上下文精度舍入），无效或不是有限数（inf、nan）时抛出 ValueError"""
+        try:
+            value = self.context.create_decimal(text)
+        except self.decimal_error:
+            raise ValueError(f"无效的数字: {text}")
+        if not value.is_finite():
+            raise ValueError(f"无效的数字: {text}")
+        return value
+
+    def add(self, a, b):
+        return self.context.add(a, b)
+
+    def subtract(self, a, b):
+        return self.context.subtract(a, b)
+
+    def negate(self, value):
+        return self.context.minus(value)
+
+    def format(self, value):
+        return str(value)
+
+
+# 内置数值后端，首次使用时创建（每种一个实例）
+BACKENDS = {
+    "float": FloatBackend,
+    "fraction": FractionBackend,
+    "decimal": DecimalBackend,
+}
+_backend_instances = {"float": FloatBackend()}
+
+
+def get_backend(backend=None, tier=None):
+    """获取数值后端：可传入后端名称或实例，未指定时使用等级的默认后端"""
+    if backend is None:
+        backend = LEVELS[tier]["backend"] if tier is not None else "float"
+    if not isinstance(backend, str):
+        return backend
+
+    instance = _backend_instances.get(backend)
+    if instance is None:
+        if backend not in BACKENDS:
+            raise ValueError(f"未知的数值后端: {backend}")
+        instance = _backend_instances[backend] = BACKENDS[backend]()
+    return instance
+
+
+# 词法单元：数字字面量（十进制、科学计数法）、其他操作数文本（如 inf、3/4，
+# 交给数值后端判断是否有效）或加减号
+_NUMBER = r"(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?"
+_TOKEN_PATTERN = rf"\s*(?:({_NUMBER}(?=[\s+-]|$)|[^\s+-]+)|([+-]))"
+
+# 最常见的 "a+b" 形式直接匹配，不必逐个处理词法单元
+_BINARY_PATTERN = rf"\s*({_NUMBER})\s*([+-])\s*({_NUMBER})\s*"
+
+# 编译后的 fullmatch / findall，首次解析时才导入 re 并编译
+_binary_fullmatch = _token_findall = None
+
+
+def _compile_patterns():
+    global _binary_fullmatch, _token_findall
+    import re
+    _token_findall = re.compile(_TOKEN_PATTERN).findall
+    _binary_fullmatch = re.compile(_BINARY_PATTERN).fullmatch
+
+
+def parse(expression):
+    """解析表达式，返回语法树
+
+    支持一元正负号、科学计数法、任意空白和连续加减（如 -1e3 + 2 - -3），
+    连续加减按左结合构造 BinaryOp。语法树只含操作数文本，与数值后端无关。
+    """
+    # 最常见的两个非负整数相加减（如 "12+3"），只用字符串方法切分，不经过正则
+    a, operator, b = expression.partition("+")
+    if not operator:
+        a, operator, b = expression.partition("-")
+    if operator and a.isdigit() and b.isdigit() and expression.isascii():
+        return _tuple_new(BinaryOp, (operator, _tuple_new(Number, (a,)), _tuple_new(Number, (b,))))
+
+    if _binary_fullmatch is None:
+        _compile_patterns()
+    match = _binary_fullmatch(expression)
+    if match:
+        a, operator, b = match.groups()
+        return _tuple_new(BinaryOp, (operator, _tuple_new(Number, (a,)), _tuple_new(Number, (b,))))
+    return _parse_tokens(expression)
+
+
+@lru_cache(maxsize=4096)
+def _parse_tokens(expression):
+    """逐个处理词法单元构造语法树（按表达式缓存，"a+b" 形式直接匹配更快，不经过缓存）"""
+    tokens = _token_findall(expression)
+    if not tokens:
+        raise CalculationError("错误：请输入算式")
+
+    tree = operator = None
+    signs = []
+    for operand, sign in tokens:
+        if sign:
+            if tree is not None and operator is None:
+                operator = sign
+            else:
+                signs.append(sign)
+            continue
+
+        if tree is not None and operator is None:
+            raise CalculationError("错误：表达式格式不正确")
+
+        node = _tuple_new(Number, (operand,))
+        for sign in reversed(signs):
+            if sign == '-':
+                node = _tuple_new(Negate, (node,))
+        signs.clear()
+
+        tree = node if tree is None else _tuple_new(BinaryOp, (operator, tree, node))
+        operator = None
+
+    if signs or operator is not None:
+        raise CalculationError("错误：表达式格式不正确")
+    if type(tree) is not BinaryOp:
+        raise CalculationError("错误：只支持加法和减法，请使用 + 或 -")
+    return tree
+
+
+def normalize(expression):
+    """规范化表达式：去掉空白和多余的正号，语法相同的表达式得到相同的文本"""
+    return _format_node(parse(expression))
+
+
+def _format_node(node):
+    if type(node) is BinaryOp:
+        return f"{_format_node(node.left)}{node.operator}{_format_node(node.right)}"
+    if type(node) is Negate:
+        return "-" + _format_node(node.operand)
+    return node.text
+
+
+def _node_value(node, backend):
+    """计算操作数节点（数字及其一元负号）的值"""
+    negative = False
+    while type(node) is Negate:
+        negative = not negative
+        node = node.operand
+
+    value = backend.parse(node.text)
+    return backend.negate(value) if negative else value
+
+
+def parse_operands(expression, backend=None):
+    """解析表达式，返回 (运算符元组, 操作数元组)，操作数已由数值后端解析"""
+    backend = get_backend(backend)
+    tree = parse(expression)
+
+    # 展开左结合的加减链
+    operators, nodes = [], []
+    while type(tree) is BinaryOp:
+        operators.append(tree.operator)
+        nodes.append(tree.right)
+        tree = tree.left
+    nodes.append(tree)
+
+    try:
+        operands = tuple(_node_value(node, backend) for node in reversed(nodes))
+    except ValueError:
+        raise CalculationError("错误：请输入有效的数字")
+
+    return tuple(reversed(operators)), operands
+
+
+def check_permission(level, a, b, levels=LEVELS):
+    """检查指定等级是否有权限进行计算，返回 (是否允许, 提示信息)"""
+    max_num = levels[level]["max_number"]
+
+    # 检查数字大小（直接比较而不取 abs：Decimal 的 abs 按当前上下文舍入，指数过大时会溢出）
+    if max_num != float('inf') and not (-max_num <= a <= max_num and -max_num <= b <= max_num):
+        return False, f"当前版本仅支持{max_num}以内的计算，请升级到更高级别！"
+
+    return True, ""
+
+
+def check_operands(can_calculate, operators, operands):
+    """检查每个操作数的权限：相邻两个操作数及其间的运算符为一组"""
+    for i, operator in enumerate(operators):
+        can_calc, msg = can_calculate(operands[i], operands[i + 1], operator)
+        if not can_calc:
+            return False, msg
+    return True, ""
+
+
+def _tier_permission(tier):
+    """按等级检查权限的 can_calculate 函数"""
+    return lambda a, b, operator: check_permission(tier, a, b)
+
+
+def compute(operator, a, b, backend=None):
+    """计算结果"""
+    backend = get_backend(backend)
+    try:
+        if operator == '+':
+            return backend.add(a, b)
+        return backend.subtract(a, b)
+    except (ArithmeticError, MemoryError):
+        # 精确模式下结果超出有效位数
+        raise CalculationError("错误：计算结果超出精度范围")
+
+
+def compute_operands(operators, operands, backend=None):
+    """从左到右依次计算，返回 Result"""
+    backend = get_backend(backend)
+    value = operands[0]
+    operations = []
+    for operator, b in zip(operators, operands[1:]):
+        result = compute(operator, value, b, backend)
+        operations.append(Operation(operator, value, b, result))
+        value = result
+    return Result(operands, tuple(operations), value)
+
+
+def calculate(expression, can_calculate, backend=None):
+    """解析表达式、检查权限并计算，返回 Result"""
+    backend = get_backend(backend)
+    operators, operands = parse_operands(expression, backend)
+
+    can_calc, msg = check_operands(can_calculate, operators, operands)
+    if not can_calc:
+        raise PermissionDenied(f"权限错误: {msg}")
+
+    return compute_operands(operators, operands, backend)
+
+
+def evaluate(expression, tier="Plus", backend=None):
+    """解析并计算表达式（不生成推导过程）"""
+    return calculate(expression, _tier_permission(tier), get_backend(backend, tier))
+
+
+def format_expression(result, backend=None):
+    """按数值后端格式化结果中的算式，如 "1.0 + 2.0 - 3.0\""""
+    format_number = get_backend(backend).format
+    parts = [format_number(result.operands[0])]
+    for operation in result.operations:
+        parts.append(operation.operator)
+        parts.append(format_number(operation.b))
+    return " ".join(parts)
+
+
+def iter_evaluate(expressions, tier="Plus", can_calculate=None, backend=None):
+    """逐个计算表达式，逐条产出 BatchResult
+
+    can_calculate 为权限检查函数（如 UserManager.can_calculate），
+    未提供时按 tier 等级检查。单个表达式出错不会中断整批计算。
+    """
+    backend = get_backend(backend, tier)
+    if can_calculate is None:
+        can_calculate = _tier_permission(tier)
+
+    for expression in expressions:
+        try:
+            operators, operands = parse_operands(expression, backend)
+        except CalculationError as e:
+            yield BatchResult(expression, None, None, str(e))
+            continue
+
+        can_calc, msg = check_operands(can_calculate, operators, operands)
+        if not can_calc:
+            yield BatchResult(expression, None, False, f"权限错误: {msg}")
+            continue
+
+        try:
+            result = compute_operands(operators, operands, backend)
+        except CalculationError as e:
+            yield BatchResult(expression, None, True, str(e))
+            continue
+
+        yield BatchResult(expression, result, True, "")
+
+
+def evaluate_batch(expressions, tier="Plus", can_calculate=None, backend=None):
+    """批量计算表达式，返回 BatchResult 列表"""
+    return list(iter_evaluate(expressions, tier, can_calculate, backend))
+
+
+# 流式大数加法：每次读取的字节数、每段按整数相加的位数
+STREAM_BLOCK_SIZE = 1 << 16
+STREAM_CHUNK_DIGITS = 4000
+
+# 数字之间允许出现的空白（如换行折行的超长数字）
+_WHITESPACE = b" \t\r\n\f\v"
+
+
+class DigitStream:
+    """从文件或标准输入按位读取非负整数
+
+    第一遍扫描统计位数并校验，第二遍按需读取指定位数，内存占用
+    与数字长度无关。不可回退的输入（如管道）先写入临时文件。
+    """
+
+    def __init__(self, source):
+        self.owned = False
+        if isinstance(source, (str, bytes, os.PathLike)):
+            self.file = open(source, "rb")
+            self.owned = True
+        else:
+            self.file = getattr(source, "buffer", source)  # 文本流取其二进制缓冲区
+            if not self.file.seekable():
+                self.file = self.spool(self.file)
+                self.owned = True
+        self.start = self.file.tell()
+        self.padding = 0
+        self.buffer = b""
+
+    @staticmethod
+    def spool(file):
+        """把不可回退的输入复制到临时文件（超过 1MB 时落盘）"""
+        import tempfile
+        spooled = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+        while True:
+            block = file.read(STREAM_BLOCK_SIZE)
+            if not block:
+                break
+            spooled.write(block)
+        spooled.seek(0)
+        return spooled
+
+    def blocks(self):
+        """逐块读取去除空白后的数字"""
+        while True:
+            block = self.file.read(STREAM_BLOCK_SIZE)
+            if not block:
+                return
+            block = block.translate(None, _WHITESPACE)
+            if block:
+                yield block
+
+    def count(self):
+        """统计位数并校验只含数字，完成后回到开头"""
+        total = 0
+        for block in self.blocks():
+            if not block.isdigit():
+                raise CalculationError("错误：请输入有效的数字")
+            total += len(block)
+        if not total:
+            raise CalculationError("错误：请输入有效的数字")
+        self.file.seek(self.start)
+        return total
+
+    def pad(self, zeros):
+        """在最高位前补零，使两个操作数对齐"""
+        self.padding = zeros
+
+    def read(self, count):
+        """读取接下来的 count 位数字"""
+        zeros = min(count, self.padding)
+        self.padding -= zeros
+        count -= zeros
+
+        if len(self.buffer) < count:
+            parts = [self.buffer]
+            size = len(self.buffer)
+            for block in self.blocks():
+                parts.append(block)
+                size += len(block)
+                if size >= count:
+                    break
+            self.buffer = b"".join(parts)
+
+        digits, self.buffer = self.buffer[:count], self.buffer[count:]
+        return b"0" * zeros + digits
+
+    def close(self):
+        if self.owned:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _DigitWriter:
+    """输出结果数字，去掉前导零"""
+
+    def __init__(self, out):
+        self.out = out
+        self.started = False
+        self.digits = 0
+
+    def write(self, digits):
+        if not self.started:
+            digits = digits.lstrip("0")
+            if not digits:
+                return
+            self.started = True
+        self.out.write(digits)
+        self.digits += len(digits)
+
+    def repeat(self, digit, count):
+        """输出 count 个相同数字（分块写出，不在内存中拼出整串）"""
+        block = digit * min(count, STREAM_BLOCK_SIZE)
+        while count > 0:
+            self.write(block[:count])
+            count -= len(block)
+
+    def finish(self):
+        """结果为 0 时输出一个 0"""
+        if not self.started:
+            self.out.write("0")
+            self.started = True
+            self.digits = 1
+
+
+def stream_add(source_a, source_b, out, tier="So Big", chunk_digits=STREAM_CHUNK_DIGITS):
+    """流式相加两个非负整数，结果数字逐段写入 out，返回结果位数
+
+    source_a / source_b 为文件路径或文件对象（可以是标准输入）。
+    从最高位开始按段相加：某段加满（全为 9）时暂不输出，
+    直到后面的段确定是否进位，因此内存占用与数字长度无关，
+    也不受 int 与字符串互转的位数限制。
+    """
+    max_num = LEVELS[tier]["max_number"]
+    if max_num != float('inf'):
+        raise CalculationError(f"权限错误: 当前版本仅支持{max_num}以内的计算，请升级到更高级别！")
+
+    # 每段位数不能超过 int 与字符串互转的限制
+    limit = getattr(sys, "get_int_max_str_digits", lambda: 0)()
+    if limit:
+        chunk_digits = min(chunk_digits, limit)
+
+    with DigitStream(source_a) as a, DigitStream(source_b) as b:
+        length_a, length_b = a.count(), b.count()
+        remaining = max(length_a, length_b)
+        a.pad(remaining - length_a)
+        b.pad(remaining - length_b)
+
+        writer = _DigitWriter(out)
+        # 待定段：可能还要加上后面段的进位；其后跟着 nines 位待定的 9
+        pending, pending_width, nines = 0, 1, 0
+        width = remaining % chunk_digits or chunk_digits
+
+        while remaining:
+            total = int(a.read(width)) + int(b.read(width))
+            full = 10 ** width
+            if total < full - 1:
+                writer.write(str(pending).zfill(pending_width))
+                writer.repeat("9", nines)
+                pending, pending_width, nines = total, width, 0
+            elif total == full - 1:
+                nines += width
+            else:
+                # 产生进位：待定段加一，其后的 9 全部变为 0
+                writer.write(str(pending + 1).zfill(pending_width))
+                writer.repeat("0", nines)
+                pending, pending_width, nines = total - full, width, 0
+            remaining -= width
+            width = chunk_digits
+
+        writer.write(str(pending).zfill(pending_width))
+        writer.repeat("9", nines)
+        writer.finish()
+        return writer.digits
+
+
+def paced_chunks(steps, pacing, frame_interval=FRAME_INTERVAL):
+    """按输出节奏把推导步骤合并成输出块，产出 (文本, 输出后等待秒数)
+
+    逐字输出时，一个块内的字符等待时间累计满一帧才输出，
+    因此接收方每帧最多刷新一次，而字符出现的节奏与逐字输出一致。
+    即时模式下整个推导过程合并为一个块。
+    """
+    char_delay = pacing.char_delay
+    buffer = []
+    pending = 0.0
+
+    for step in steps:
+        text = step.text
+        if char_delay > 0:
+            pos = 0
+            while pos < len(text):
+                # 凑够一帧所需的字符数
+                count = max(1, math.ceil((frame_interval - pending) / char_delay))
+                piece = text[pos:pos + count]
+                pos += len(piece)
+                buffer.append(piece)
+                pending += len(piece) * char_delay
+                if pending >= frame_interval:
+                    yield "".join(buffer), pending
+                    buffer.clear()
+                    pending = 0.0
+        else:
+            buffer.append(text)
+        buffer.append("\n")
+
+        pending += pacing.pause(step.pause)
+        if pending >= frame_interval:
+            yield "".join(buffer), pending
+            buffer.clear()
+            pending = 0.0
+
+    if buffer:
+        yield "".join(buffer), pending
+
+
+def play(steps, pacing, write, token=None, frame_interval=FRAME_INTERVAL):
+    """按输出节奏把推导步骤逐块交给 write
+
+    提供 token 时，每块输出前检查是否已取消，等待也可以被立即打断，
+    取消后最多再输出一块即抛出 CalculationCancelled。
+    """
+    sleep = time.sleep if token is None else token.sleep
+    for chunk, delay in paced_chunks(steps, pacing, frame_interval):
+        if token is not None:
+            token.check()
+        write(chunk)
+        if delay > 0:
+            sleep(delay)
+
+
+def derive(expression, backend=None):
+    """生成表达式的推导步骤（不检查权限）"""
+    backend = get_backend(backend)
+    result = calculate(expression, lambda a, b, operator: (True, ""), backend)
+    return result_steps(result, backend)
+
+
+async def derive_stream(expression, tier="Plus", pace=None, backend=None, can_calculate=None,
+                        frame_interval=FRAME_INTERVAL):
+    """异步逐块产出推导过程（默认按 realtime 节奏）
+
+    用 asyncio.sleep 等待，不占用线程，一个事件循环即可同时输出大量推导。
+    pace 可以是 Pacing 或 Pacing.parse 接受的文本；can_calculate 未提供时
+    按 tier 等级检查权限。表达式无效或无权限时在第一次迭代时抛出
+    CalculationError。同时输出的推导很多时，可调大 frame_interval 减少唤醒次数。
+    """
+    import asyncio
+
+    backend = get_backend(backend, tier)
+    if pace is None:
+        pace = Pacing.realtime()
+    elif isinstance(pace, str):
+        pace = Pacing.parse(pace)
+
+    result = calculate(expression, can_calculate or _tier_permission(tier), backend)
+
+    # 按绝对时间安排每一块，事件循环繁忙时等待误差不会逐块累积
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    for chunk, delay in paced_chunks(result_steps(result, backend), pace, frame_interval):
+        yield chunk
+        if delay > 0:
+            deadline += delay
+            await asyncio.sleep(deadline - loop.time())
+
+
+def result_steps(result, backend=None):
+    """按运算顺序依次生成每个二元运算的推导步骤"""
+    for operation in result.operations:
+        yield from derivation_steps(operation.operator, operation.a, operation.b, backend)
+
+
+def render_result(result, backend=None):
+    """渲染结果中全部运算的推导文本"""
+    return "".join(
+        render_transcript(operation.operator, operation.a, operation.b, backend)
+        for operation in result.operations
+    )
+
+
+def _render_chunk(start, expressions, tier, backend, levels):
+    """渲染一组表达式的推导文本（并行渲染时在工作进程中执行）
+
+    返回普通元组而不是 Transcript：进程间传回结果时，反序列化具名元组的
+    开销约为普通元组的两倍。
+    """
+    can_calculate = lambda a, b, operator: check_permission(tier, a, b, levels)
+
+    rows = []
+    for index, item in enumerate(iter_evaluate(expressions, tier, can_calculate, backend), start):
+        text = None if item.result is None else render_result(item.result, backend)
+        rows.append((index, item.expression, text, item.error))
+    return rows
+
+
+def _chunked(expressions, chunk_size):
+    """按 chunk_size 分组，产出 (首个表达式的序号, 表达式列表)"""
+    iterator = iter(expressions)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def render_batch(expressions, tier="Plus", backend=None, levels=LEVELS, workers=None,
+                 chunk_size=RENDER_CHUNK_SIZE, ordered=True, sink=None):
+    """用多个进程渲染一批表达式的推导文本，逐个产出 Transcript
+
+    表达式按 chunk_size 分组提交到进程池，在途的任务数不超过进程数的两倍，
+    因此超大批量（包括迭代器）也不会一次性读入内存。ordered 为 False 时
+    按完成顺序产出（可用 Transcript.index 还原顺序）。提供 sink 时，推导
+    文本统一由当前进程按产出顺序写入 sink，多个进程的输出不会交错。
+    workers 为 1 时直接在当前进程中渲染。
+    """
+    backend = get_backend(backend, tier)
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunked(expressions, chunk_size)
+
+    if workers == 1:
+        batches = (_render_chunk(start, chunk, tier, backend, levels) for start, chunk in chunks)
+    else:
+        batches = _render_in_pool(chunks, tier, backend, levels, workers, ordered)
+
+    for rows in batches:
+        for transcript in map(Transcript._make, rows):
+            if sink is not None and transcript.text is not None:
+                sink.write(transcript.text)
+            yield transcript
+
+
+def _render_in_pool(chunks, tier, backend, levels, workers, ordered):
+    """在进程池中渲染各组表达式，逐组产出结果"""
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    executor = ProcessPoolExecutor(workers)
+    pending = deque()
+    try:
+        pending.extend(
+            executor.submit(_render_chunk, start, chunk, tier, backend, levels)
+            for start, chunk in islice(chunks, workers * 2)
+        )
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+
+            # 先补充任务再等待结果，保持所有进程忙碌
+            for start, chunk in islice(chunks, 1):
+                pending.append(executor.submit(_render_chunk, start, chunk, tier, backend, levels))
+
+            yield future.result()
+    finally:
+        # 调用方提前停止迭代时，取消尚未开始的任务
+        # （shutdown 的 cancel_futures 参数需要 Python 3.9）
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def derivation_steps(operator, a, b, backend=None):
+    """按操作符生成推导步骤"""
+    backend = get_backend(backend)
+    result = compute(operator, a, b, backend)
+    return TEMPLATES[operator].steps(a=backend.format(a), b=backend.format(b), result=backend.format(result))
+
+
+def render_transcript(operator, a, b, backend=None):
+    """渲染完整的推导文本（不含输出节奏）
+
+    操作数较短时使用缓存；超大数的推导文本直接渲染，不放入缓存。
+    """
+    backend = get_backend(backend)
+    a_text, b_text = backend.format(a), backend.format(b)
+    if len(a_text) + len(b_text) > TRANSCRIPT_CACHE_MAX_CHARS:
+        result = compute(operator, a, b, backend)
+        return TEMPLATES[operator].render(a=a_text, b=b_text, result=backend.format(result))
+    return _cached_transcript(backend, operator, a_text, b_text)
+
+
+@lru_cache(maxsize=4096)
+def _cached_transcript(backend, operator, a_text, b_text):
+    """按 (操作符, a, b) 缓存渲染好的推导文本
+
+    以格式化后的操作数为键：0.0 与 -0.0、Decimal("1.0") 与 Decimal("1.00")
+    数值相等但显示不同，不能共用缓存。
+    """
+    result = compute(operator, backend.parse(a_text), backend.parse(b_text), backend)
+    return TEMPLATES[operator].render(a=a_text, b=b_text, result=backend.format(result))
+
+
+class DerivationTemplate:
+    """推导过程模板
+
+    绝大部分推导行与操作数无关，构建模板时即拼接为静态文本；
+    只有标记为 dynamic 的行需要代入 {a}、{b}、{result}。
+    整个推导编译为一个格式化字符串，渲染时只需填充参数。
+    """
+
+    def __init__(self, lines):
+        self.lines = tuple(lines)
+        self._format = "".join(
+            (line.text if line.dynamic else line.text.replace("{", "{{").replace("}", "}}")) + "\n"
+            for line in self.lines
+        )
+
+    def steps(self, **values):
+        """生成推导步骤"""
+        for line in self.lines:
+            text = line.text.format(**values) if line.dynamic else line.text
+            yield Step(text, line.pause)
+
+    def render(self, **values):
+        """渲染完整推导文本"""
+        return self._format.format(**values)
+
+
+# 模板中的一行：pause 为输出后的停顿秒数，dynamic 表示需要代入参数
+Line = namedtuple("Line", ["text", "pause", "dynamic"], defaults=(0, False))
+
+ADDITION_TEMPLATE = DerivationTemplate([
+    Line("开始计算 {a} + {b} ...", 1, dynamic=True),
+
+    Line("\n=== 阶段1: 欧拉公式推导 ===", 0.5),
+    Line("exp(z) = Σ[n=0→∞] z^n/n!", 0.5),
+    Line("令 z = iπ，得到 exp(iπ) = Σ[n=0→∞] (iπ)^n/n!", 0.5),
+    Line("i^0 = 1, i^1 = i, i^2 = -1, i^3 = -i, i^4 = 1, ...", 0.5),
+    Line("分离实部和虚部："),
+    Line("exp(iπ) = Σ[k=0→∞] (-1)^k π^{2k}/(2k)! + iΣ[k=0→∞] (-1)^k π^{2k+1}/(2k+1)!", 0.5),
+    Line("这对应余弦和正弦的泰勒级数："),
+    Line("cos(π) = Σ[k=0→∞] (-1)^k π^{2k}/(2k)! = -1"),
+    Line("sin(π) = Σ[k=0→∞] (-1)^k π^{2k+1}/(2k+1)! = 0", 0.5),
+    Line("因此：exp(iπ) = cos(π) + i sin(π) = -1 + 0i = -1", 0.5),
+    Line("欧拉恒等式：exp(iπ) + 1 = 0", 0.5),
+
+    Line("\n=== 阶段2: 定义辅助函数 ===", 0.5),
+    Line("定义 f(θ) = exp(iθ) + exp(-iθ)", 0.5),
+    Line("使用欧拉公式："),
+    Line("f(θ) = (cosθ + i sinθ) + (cosθ - i sinθ)"),
+    Line("f(θ) = 2cosθ", 0.5),
+
+    Line("\n=== 阶段3: 计算f(0) ===", 0.5),
+    Line("方法1: 直接计算"),
+    Line("f(0) = exp(i·0) + exp(-i·0)"),
+    Line("exp(0) = Σ[n=0→∞] 0^n/n! = 1"),
+    Line("因此 f(0) = 1 + 1", 0.5),
+    Line("\n方法2: 通过f(θ) = 2cosθ计算"),
+    Line("f(0) = 2cos(0)"),
+    Line("cos(0) = Σ[k=0→∞] (-1)^k·0^(2k)/(2k)! = 1"),
+    Line("因此 f(0) = 2·1 = 2", 0.5),
+
+    Line("\n=== 阶段4: 积分验证 ===", 0.5),
+    Line("计算积分 I = ∫[0,π/2] sin²φ dφ = π/4"),
+    Line("计算积分 J = ∫[0,π/2] cos²φ dφ = π/4", 0.5),
+    Line("定义 A = (2/π)I = 1/2, B = (2/π)J = 1/2"),
+    Line("则 2A = 1, 2B = 1"),
+    Line("2A + 2B = 1 + 1", 0.5),
+    Line("但 2A + 2B = 2(A+B) = 2(2/π I + 2/π J)"),
+    Line("= (4/π)(I+J) = (4/π)(π/2) = 2", 0.5),
+
+    Line("\n=== 阶段5: 微分方程验证 ===", 0.5),
+    Line("解微分方程 dy/dx = y, y(0) = 1"),
+    Line("解为 y(x) = exp(x)"),
+    Line("计算 y(ln2) = exp(ln2) = 2", 0.5),
+    Line("注意到 y(0) = 1"),
+    Line("y(ln2) = 2y(0) = 2·1 = 2", 0.5),
+
+    Line("\n=== 阶段6: 代数验证 ===", 0.5),
+    Line("考虑恒等式 (1+1)² = 1² + 2·1·1 + 1² = 1 + 2 + 1 = 4"),
+    Line("因此 1 + 1 = √4 = 2 (取正根)", 0.5),
+
+    Line("\n=== 阶段7: 推广到一般情况 ===", 0.5),
+    Line("将上述推导中的'1'替换为具体的数值:"),
+    Line("设 x = {a}, y = {b}", dynamic=True),
+    Line("\n根据加法交换律和结合律:"),
+    Line("x + y = {a} + {b}", dynamic=True),
+    Line("\n根据实数域的完备性:"),
+    Line("存在唯一实数 r 使得 r = {a} + {b}", 0.5, dynamic=True),
+
+    Line("\n" + "="*50),
+    Line("最终结论：{a} + {b} = {result}", dynamic=True),
+    Line("="*50),
+])
+
+SUBTRACTION_TEMPLATE = DerivationTemplate([
+    Line("开始计算 {a} - {b} ...", 1, dynamic=True),
+
+    Line("\n=== 阶段1: 转换为加法 ===", 0.5),
+    Line("减法 {a} - {b} 可以转化为加法:", dynamic=True),
+    Line("{a} - {b} = {a} + (-{b})", 0.5, dynamic=True),
+
+    Line("\n=== 阶段2: 使用加法推导 ===", 0.5),
+    Line("根据加法推导:"),
+    Line("{a} + (-{b}) = {result}", 0.5, dynamic=True),
+
+    Line("\n" + "="*50),
+    Line("最终结论：{a} - {b} = {result}", dynamic=True),
+    Line("="*50),
+])
+
+TEMPLATES = {'+': ADDITION_TEMPLATE, '-': SUBTRACTION_TEMPLATE}
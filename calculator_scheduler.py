@@ -0,0 +1,149 @@
+"""Intelligence Calculator 计算任务调度器
+
+固定数量的工作线程加一个有界优先队列：会员等级越高优先级越高，同一等级
+先到先算；队列满时直接拒绝，而不是无限制地创建线程。不依赖 PyQt5：
+
+    scheduler = CalculationScheduler(workers=2, max_queue=16)
+    future = scheduler.submit(task.run, level="Max")
+    scheduler.metrics()   -> SchedulerMetrics
+"""
+
+import time
+import heapq
+import threading
+from collections import namedtuple, deque
+from concurrent.futures import Future
+
+from calculator_engine import LEVELS
+
+
+# 调度器状态：排队数、执行中数、累计完成 / 拒绝 / 取消数，以及排队等待时间（秒）
+SchedulerMetrics = namedtuple("SchedulerMetrics", [
+    "queue_depth", "running", "completed", "rejected", "cancelled",
+    "average_wait", "recent_max_wait",
+])
+
+
+class SchedulerFull(Exception):
+    """排队的任务已达上限"""
+
+
+class CalculationScheduler:
+    """计算任务调度器
+
+    submit 返回 concurrent.futures.Future：排队中的任务可以用 cancel()
+    取消；任务开始后能否中途停止取决于任务本身。
+    """
+
+    # 计算最近等待时间时保留的样本数
+    RECENT_SAMPLES = 100
+
+    def __init__(self, workers=2, max_queue=16, levels=LEVELS):
+        self.max_queue = max_queue
+        # 等级在配置中越靠后（价格越高）优先级越高
+        self.priorities = {level: rank for rank, level in enumerate(levels)}
+
+        self._queue = []  # 堆：(-优先级, 序号, 提交时间, Future, 函数, 位置参数, 关键字参数)
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._shutdown = False
+
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._cancelled = 0
+        self._total_wait = 0.0
+        self._started = 0
+        self._recent_waits = deque(maxlen=self.RECENT_SAMPLES)
+
+        self._workers = [
+            threading.Thread(target=self._work, name=f"calculation-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, function, *args, level="Plus", **kwargs):
+        """按等级优先级排队执行 function，返回 Future；队列已满时抛出 SchedulerFull"""
+        future = Future()
+        future.add_done_callback(self._count_cancelled)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("调度器已关闭")
+
+            if len(self._queue) >= self.max_queue:
+                self._discard_cancelled()
+            if len(self._queue) >= self.max_queue:
+                self._rejected += 1
+                raise SchedulerFull(f"计算请求过多（排队上限 {self.max_queue}），请稍后再试")
+
+            self._sequence += 1
+            entry = (-self.priorities.get(level, 0), self._sequence, time.monotonic(), future, function, args, kwargs)
+            heapq.heappush(self._queue, entry)
+            self._condition.notify()
+        return future
+
+    def _count_cancelled(self, future):
+        """Future 的完成回调：任务被取消时计数（每个 Future 只回调一次）"""
+        if future.cancelled():
+            with self._condition:
+                self._cancelled += 1
+
+    def _discard_cancelled(self):
+        """移出已取消的排队任务（调用时需持有锁）"""
+        queue = [entry for entry in self._queue if not entry[3].cancelled()]
+        heapq.heapify(queue)
+        self._queue = queue
+
+    def _work(self):
+        """工作线程：按优先级取出任务并执行"""
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return  # 已关闭且没有待执行的任务
+
+                _, _, submitted, future, function, args, kwargs = heapq.heappop(self._queue)
+                if not future.set_running_or_notify_cancel():
+                    continue  # 排队时已取消，已由 _count_cancelled 计数
+
+                wait = time.monotonic() - submitted
+                self._started += 1
+                self._total_wait += wait
+                self._recent_waits.append(wait)
+                self._running += 1
+
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._condition:
+                    self._running -= 1
+                    self._completed += 1
+
+    def metrics(self):
+        """返回当前的 SchedulerMetrics"""
+        with self._condition:
+            depth = sum(1 for entry in self._queue if not entry[3].cancelled())
+            average = self._total_wait / self._started if self._started else 0.0
+            recent_max = max(self._recent_waits, default=0.0)
+            return SchedulerMetrics(depth, self._running, self._completed, self._rejected,
+                                    self._cancelled, average, recent_max)
+
+    def shutdown(self, wait=True, cancel_pending=True):
+        """停止接受新任务；cancel_pending 为 True 时取消所有排队中的任务"""
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for entry in self._queue:
+                    # 已取消的任务不再调用 cancel()：它对已取消的 Future 也返回 True
+                    if not entry[3].cancelled():
+                        entry[3].cancel()
+                self._queue.clear()
+            self._condition.notify_all()
+
+        if wait:
+            for worker in self._workers:
+                worker.join()
@@ -0,0 +1,398 @@
+"""Intelligence Calculator 服务器模式
+
+基于 asyncio 的轻量 HTTP 服务（只用标准库，不加载 PyQt5），一个进程即可
+同时服务大量客户端：
+
+    python "Intelligence Calculator.py" --serve 127.0.0.1:8765 --api-keys keys.json
+
+接口：
+
+    POST /calculate      请求体 {"expression": "1+1"}，返回 JSON 结果
+    GET  /derive?expression=1%2B1&pace=realtime
+                         以 Server-Sent Events 逐块推送推导过程，
+                         最后推送 result 事件
+    GET  /health         健康检查（含结果缓存的命中统计）
+
+API Key 通过 X-API-Key 头、Authorization: Bearer 头或 api_key 查询参数
+传递（浏览器的 EventSource 无法设置请求头）。keys.json 把每个 API Key
+映射到一个用户信息文件，权限检查由对应的 UserManager 完成；未指定
+--api-keys 时所有请求都使用本地的 user_info.json。用户较多时可以用
+--profiles users.sqlite3 把全部用户保存在一个 SQLite 数据库中，此时
+keys.json 的值为用户 ID。
+"""
+
+import os
+import sys
+import json
+import asyncio
+import argparse
+import traceback
+from urllib.parse import urlsplit, parse_qs
+
+from calculator_cache import CACHE_FILE, ResultCache, SQLiteStore, result_cache_path
+from calculator_core import ThemeManager, UserManager
+from calculator_engine import CalculationError, Pacing, PermissionDenied, derive_stream
+from calculator_storage import SQLiteProfileStore
+
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+
+# 每个连接的资源上限：请求头单行长度、请求头行数、请求体字节数、空闲秒数
+MAX_LINE = 8 * 1024
+MAX_HEADERS = 64
+MAX_BODY = 64 * 1024
+IDLE_TIMEOUT = 30
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """请求错误，按状态码返回 JSON 错误信息"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Request:
+    """解析后的 HTTP 请求"""
+
+    def __init__(self, method, target, version, headers, body=b""):
+        self.method = method
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+        url = urlsplit(target)
+        self.path = url.path
+        self.query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+    @property
+    def keep_alive(self):
+        """是否保持连接（HTTP/1.1 默认保持）"""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    @property
+    def api_key(self):
+        """请求携带的 API Key"""
+        if "x-api-key" in self.headers:
+            return self.headers["x-api-key"]
+        scheme, _, token = self.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer":
+            return token.strip()
+        return self.query.get("api_key")
+
+    def json(self):
+        """解析 JSON 请求体"""
+        try:
+            data = json.loads(self.body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "请求体不是有效的 JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "请求体必须是 JSON 对象")
+        return data
+
+
+async def read_line(reader):
+    """读取一行，超过 MAX_LINE 时返回 431"""
+    try:
+        return await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+    except ValueError:
+        raise HTTPError(431, "请求头过长")
+
+
+async def read_request(reader):
+    """读取一个请求，连接关闭或空闲超时时返回 None"""
+    try:
+        line = await read_line(reader)
+    except asyncio.TimeoutError:
+        return None
+    if not line.strip():
+        return None
+
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "无效的请求行")
+
+    headers = {}
+    while True:
+        line = await read_line(reader)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise HTTPError(431, "请求头过多")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(400, "无效的 Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(413, f"请求体不能超过 {MAX_BODY} 字节")
+    body = await asyncio.wait_for(reader.readexactly(length), IDLE_TIMEOUT) if length > 0 else b""
+
+    return Request(method.upper(), target, version, headers, body)
+
+
+def encode_response(status, payload, keep_alive=True):
+    """生成 JSON 响应"""
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def log_error(request):
+    """把处理请求时的异常输出到标准错误"""
+    target = f"{request.method} {request.path}" if request is not None else "请求"
+    print(f"处理 {target} 时出错:", file=sys.stderr)
+    traceback.print_exc()
+
+
+def encode_event(data, event=None):
+    """生成一条 Server-Sent Event（多行数据拆成多个 data 字段）"""
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+class CalculatorServer:
+    """计算服务：按 API Key 找到用户并检查权限
+
+    users 把 API Key 映射到 UserManager 或用户信息文件路径（首次使用时
+    创建 UserManager）；指定 profile_store 时映射到其中的用户 ID。
+    users 为 None 时所有请求都使用 default_user。
+    计算结果经过 cache（默认为只在内存中的 ResultCache）。
+    """
+
+    def __init__(self, users=None, default_user=None, cache=None, profile_store=None):
+        self.users = dict(users) if users is not None else None
+        self.default_user = default_user
+        self.cache = cache if cache is not None else ResultCache()
+        self.profile_store = profile_store
+
+    @classmethod
+    def from_key_file(cls, path, cache=None, profile_store=None):
+        """从 API Key 配置文件创建服务
+
+        没有 profile_store 时值为用户信息文件，相对路径相对于配置文件所在目录。
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            keys = json.load(f)
+        if profile_store is None:
+            base = os.path.dirname(os.path.abspath(path))
+            keys = {key: os.path.join(base, user_file) for key, user_file in keys.items()}
+        return cls(keys, cache=cache, profile_store=profile_store)
+
+    def user_for(self, request):
+        """返回请求对应的 UserManager（会员已到期时先降级）"""
+        if self.users is None:
+            if self.default_user is None:
+                self.default_user = UserManager(ThemeManager())
+            user = self.default_user
+        else:
+            user = self.users.get(request.api_key)
+            if user is None:
+                raise HTTPError(401, "无效的 API Key")
+            if not isinstance(user, UserManager):
+                if self.profile_store is not None:
+                    user = UserManager(ThemeManager(), store=self.profile_store, user_id=user)
+                else:
+                    user = UserManager(ThemeManager(), user)
+                self.users[request.api_key] = user
+
+        # UserManager 与服务同生命周期，会员可能在服务运行期间到期
+        user.check_expiry()
+        return user
+
+    def calculate(self, expression, user):
+        """计算表达式，返回 JSON 结果；失败时抛出 HTTPError"""
+        if not isinstance(expression, str):
+            raise HTTPError(400, "缺少 expression 参数")
+
+        try:
+            entry = self.cache.calculate(expression, user.can_calculate, user.get_number_backend())
+        except PermissionDenied as e:
+            raise HTTPError(403, str(e))
+        except CalculationError as e:
+            raise HTTPError(400, str(e))
+
+        return {"expression": entry.expression, "result": entry.result, "level": user.get_current_level()}
+
+    async def handle_calculate(self, request, writer):
+        if request.method != "POST":
+            raise HTTPError(405, "请使用 POST")
+        user = self.user_for(request)
+        payload = self.calculate(request.json().get("expression"), user)
+        writer.write(encode_response(200, payload, request.keep_alive))
+
+    async def handle_derive(self, request, writer):
+        """以 Server-Sent Events 推送推导过程，结束后关闭连接"""
+        if request.method != "GET":
+            raise HTTPError(405, "请使用 GET")
+        user = self.user_for(request)
+        expression = request.query.get("expression")
+        try:
+            pace = Pacing.parse(request.query.get("pace", "realtime"))
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+
+        # 先完成解析和权限检查，出错时仍可返回普通的 JSON 错误
+        payload = self.calculate(expression, user)
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream; charset=utf-8\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n"
+            b"\r\n"
+        )
+        chunks = derive_stream(expression, pace=pace, backend=user.get_number_backend(),
+                               can_calculate=user.can_calculate)
+        try:
+            async for chunk in chunks:
+                writer.write(encode_event(chunk))
+                # 客户端读得慢时在此等待，每个连接的缓冲区大小有上限
+                await writer.drain()
+        except ConnectionError:
+            raise
+        except Exception:
+            # 响应头已经发出，无法再返回 500，改为推送 error 事件后结束
+            log_error(request)
+            writer.write(encode_event(json.dumps({"error": "服务器内部错误"}, ensure_ascii=False), "error"))
+            return False
+        finally:
+            await chunks.aclose()
+
+        writer.write(encode_event(json.dumps(payload, ensure_ascii=False), "result"))
+        return False
+
+    async def handle_health(self, request, writer):
+        payload = {"status": "ok", "cache": self.cache.stats()._asdict()}
+        writer.write(encode_response(200, payload, request.keep_alive))
+
+    ROUTES = {
+        "/calculate": handle_calculate,
+        "/derive": handle_derive,
+        "/health": handle_health,
+    }
+
+    async def handle_connection(self, reader, writer):
+        """处理一个连接上的全部请求"""
+        try:
+            while True:
+                request = None
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    route = self.ROUTES.get(request.path)
+                    if route is None:
+                        raise HTTPError(404, f"未知的路径: {request.path}")
+                    if await route(self, request, writer) is False or not request.keep_alive:
+                        break
+                except HTTPError as e:
+                    keep_alive = request is not None and request.keep_alive
+                    writer.write(encode_response(e.status, {"error": str(e)}, keep_alive))
+                    if not keep_alive:
+                        break
+                except asyncio.TimeoutError:
+                    writer.write(encode_response(408, {"error": "请求超时"}, False))
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception:
+                    # 其他错误（如缓存或用户数据库的 sqlite3 错误）返回 500 并关闭连接
+                    log_error(request)
+                    writer.write(encode_response(500, {"error": "服务器内部错误"}, False))
+                    break
+                await writer.drain()
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # 客户端已断开
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """开始监听，返回 asyncio.Server（port 为 0 时自动分配端口）"""
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+
+
+def parse_args(argv):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(
+        prog="Intelligence Calculator",
+        description="Intelligence Calculator 服务器模式"
+    )
+    parser.add_argument("--serve", nargs="?", const=DEFAULT_ADDRESS, default=DEFAULT_ADDRESS, metavar="HOST:PORT",
+                        help=f"监听地址（默认 {DEFAULT_ADDRESS}）")
+    parser.add_argument("--api-keys", metavar="FILE",
+                        help="API Key 配置文件（JSON，键为 API Key，值为用户信息文件路径）")
+    parser.add_argument("--cache", nargs="?", const="", metavar="FILE",
+                        help=f"把计算结果缓存保存到 SQLite 文件（默认为 user_info.json 旁边的 {CACHE_FILE}）")
+    parser.add_argument("--profiles", metavar="FILE",
+                        help="从 SQLite 数据库读取用户信息（--api-keys 的值为其中的用户 ID）")
+    return parser.parse_args(argv)
+
+
+async def serve(server, host, port):
+    """启动服务并一直运行"""
+    listener = await server.start(host, port)
+    address = listener.sockets[0].getsockname()
+    print(f"Intelligence Calculator 服务已启动: http://{address[0]}:{address[1]}", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    """服务器入口，返回退出码"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    host, _, port = args.serve.rpartition(":")
+    try:
+        port = int(port)
+    except ValueError:
+        print(f"无效的监听地址: {args.serve}", file=sys.stderr)
+        return 1
+
+    cache = None
+    if args.cache is not None:
+        cache = ResultCache(store=SQLiteStore(args.cache or result_cache_path("user_info.json")))
+
+    profile_store = SQLiteProfileStore(args.profiles) if args.profiles else None
+
+    if args.api_keys:
+        server = CalculatorServer.from_key_file(args.api_keys, cache, profile_store)
+    elif profile_store is not None:
+        server = CalculatorServer(default_user=UserManager(ThemeManager(), store=profile_store), cache=cache)
+    else:
+        server = CalculatorServer(cache=cache)
+    try:
+        asyncio.run(serve(server, host or "127.0.0.1", port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,444 @@
+"""Intelligence Calculator 用户信息持久化
+
+写入先落到同目录的临时文件，fsync 后再 rename 覆盖原文件，写到一半崩溃
+也不会留下损坏的 user_info.json；ProfileWriter 把短时间内的多次保存合并为
+一次，在后台线程中写入：
+
+    writer = ProfileWriter("user_info.json")
+    writer.save(user_info)   # 立即返回，delay 秒后写入最后一次的内容
+    writer.flush()           # 立即写入尚未写入的内容
+
+用户信息存储（UserManager 的 store）提供相同的接口：
+
+    store.load(user_id)                  -> 用户信息字典，不存在时为 None
+    store.save(user_id, profile, fields) -> 保存；fields 为 None 时保存全部字段，
+                                            否则只更新指定字段（在同一事务中）
+    store.flush() / store.close()
+
+JsonProfileStore 使用单个 user_info.json（只有一个用户，忽略 user_id）；
+SQLiteProfileStore 在一个数据库中按 user_id 保存任意多个用户。
+"""
+
+import os
+import json
+import math
+import stat
+import time
+import atexit
+import threading
+from datetime import datetime
+
+from calculator_engine import LEVELS
+
+
+# 默认的合并写入延迟（秒）
+SAVE_DELAY = 0.5
+
+# 单用户存储使用的用户 ID
+DEFAULT_USER = "default"
+
+# 用户信息的字段
+PROFILE_FIELDS = ("level", "expire_date", "join_date", "theme")
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _create_temp(path):
+    """在目标文件所在目录创建临时文件，返回 (文件描述符, 临时文件路径)
+
+    以 0666 创建，由系统按 umask 去掉权限位，与直接新建目标文件时相同。
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+
+def write_atomic(path, text):
+    """原子地把文本写入文件：写临时文件、fsync、rename
+
+    覆盖已有文件时沿用其权限位，新文件的权限按 umask。
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    fd, temp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            if mode is not None and hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), mode)
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    # rename 本身也要落盘（Windows 不支持打开目录，跳过）
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def parse_date(text):
+    """把 "%Y-%m-%d %H:%M:%S"（本地时间）转换为时间戳"""
+    return datetime.strptime(text, DATE_FORMAT).timestamp()
+
+
+def format_date(timestamp):
+    """把时间戳转换为 "%Y-%m-%d %H:%M:%S"（本地时间）"""
+    return datetime.fromtimestamp(timestamp).strftime(DATE_FORMAT)
+
+
+class UserProfile:
+    """用户信息
+
+    到期时间保存为时间戳 expire_at（秒，没有到期时间时为 None），只在与
+    JSON 中的 expire_date 字符串相互转换时解析 / 格式化一次。仍然可以像
+    原来的字典一样按字段名读写（如 profile["level"]、profile["expire_date"]）。
+    """
+
+    __slots__ = ("level", "expire_at", "join_date", "theme")
+
+    def __init__(self, level="Plus", expire_at=None, join_date=None, theme="light"):
+        self.level = level
+        self.expire_at = expire_at
+        self.join_date = join_date
+        self.theme = theme
+
+    @classmethod
+    def from_dict(cls, data):
+        """从（已经过 verify_profile 检查的）字典创建"""
+        expire_date = data.get("expire_date")
+        return cls(data.get("level", "Plus"), parse_date(expire_date) if expire_date else None,
+                   data.get("join_date"), data.get("theme", "light"))
+
+    def to_dict(self):
+        """转换为保存到文件的字典（格式与原来的 user_info.json 相同）"""
+        return {"level": self.level, "expire_date": self.expire_date, "join_date": self.join_date, "theme": self.theme}
+
+    @property
+    def expire_date(self):
+        return format_date(self.expire_at) if self.expire_at is not None else None
+
+    @expire_date.setter
+    def expire_date(self, value):
+        self.expire_at = parse_date(value) if value else None
+
+    def seconds_left(self, now=None):
+        """距离到期的秒数（已过期时为负数），没有到期时间时返回 None"""
+        if self.expire_at is None:
+            return None
+        return self.expire_at - (time.time() if now is None else now)
+
+    def expired(self, now=None):
+        """是否已过期"""
+        left = self.seconds_left(now)
+        return left is not None and left < 0
+
+    def __getitem__(self, key):
+        if key not in PROFILE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in PROFILE_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return self[key] if key in PROFILE_FIELDS else default
+
+    def __eq__(self, other):
+        if not isinstance(other, UserProfile):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"UserProfile({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+
+def dump_profile(user_info):
+    """用户信息的 JSON 文本（格式与原来的 user_info.json 相同）"""
+    return json.dumps(user_info, ensure_ascii=False, indent=4)
+
+
+def verify_profile(data, levels=LEVELS):
+    """检查读取到的用户信息，返回 (修正后的副本, 问题列表)
+
+    不是 JSON 对象时抛出 ValueError；等级、到期时间或主题无效时修正为
+    免费版的默认值，手动修改文件不能解锁更高等级的主题。
+    """
+    if not isinstance(data, dict):
+        raise ValueError("用户信息必须是 JSON 对象")
+
+    profile = dict(data)
+    problems = []
+
+    if profile.get("level", "Plus") not in levels:
+        problems.append(f"未知的等级: {profile.get('level')!r}")
+        profile["level"], profile["expire_date"] = "Plus", None
+    profile.setdefault("level", "Plus")
+
+    expire_date = profile.get("expire_date")
+    if expire_date is not None:
+        try:
+            datetime.strptime(expire_date, DATE_FORMAT)
+        except (TypeError, ValueError):
+            problems.append(f"无效的到期时间: {expire_date!r}")
+            profile["level"], profile["expire_date"] = "Plus", None
+    profile.setdefault("expire_date", None)
+
+    theme = profile.get("theme", "light")
+    if theme not in levels[profile["level"]]["theme_access"]:
+        problems.append(f"当前等级不能使用主题: {theme!r}")
+        theme = "light"
+    profile["theme"] = theme
+
+    return profile, problems
+
+
+# 所有 ProfileWriter 共用一个后台写入线程：_due 记录每个有待写内容的 writer
+# 的写入时间（time.monotonic），正在写入的 writer 记为 inf
+_due = {}
+_due_condition = threading.Condition()
+_flush_thread = None
+
+
+def _schedule(writer, deadline):
+    """安排共用的后台线程在 deadline 写入 writer 的内容"""
+    global _flush_thread
+    with _due_condition:
+        _due[writer] = deadline
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_run_flush_thread, name="profile-writer", daemon=True)
+            _flush_thread.start()
+        _due_condition.notify()
+
+
+def _run_flush_thread():
+    """后台线程：依次写入到期的 ProfileWriter"""
+    while True:
+        with _due_condition:
+            while True:
+                now = time.monotonic()
+                ready = [writer for writer, deadline in _due.items() if deadline <= now]
+                if ready:
+                    break
+                waiting = [deadline for deadline in _due.values() if deadline != math.inf]
+                _due_condition.wait(min(waiting) - now if waiting else None)
+            for writer in ready:
+                _due[writer] = math.inf
+
+        for writer in ready:
+            writer._write_due()
+            with _due_condition:
+                # 写入期间没有新的保存时不再跟踪该 writer
+                if _due.get(writer) == math.inf:
+                    del _due[writer]
+
+
+@atexit.register
+def _flush_all():
+    """进程退出时写入所有尚未写入的内容"""
+    with _due_condition:
+        writers = list(_due)
+    for writer in writers:
+        writer.flush()
+
+
+class ProfileWriter:
+    """合并写入用户信息文件
+
+    save 只记录最新内容并立即返回，最后一次 save 之后 delay 秒由后台线程
+    原子写入；期间的多次保存只写一次。delay 为 0 时在调用线程中直接写入。
+    所有实例共用一个后台线程，进程退出时自动写入尚未写入的内容。
+    """
+
+    def __init__(self, path, delay=SAVE_DELAY):
+        self.path = path
+        self.delay = delay
+        self.writes = 0  # 实际写入磁盘的次数
+
+        self._pending = None
+        self._deadline = 0.0
+        self._writing = False
+        self._condition = threading.Condition()
+
+    def save(self, user_info):
+        """记录要保存的内容（此时即序列化，之后修改 user_info 不影响本次保存）"""
+        text = dump_profile(user_info)
+        with self._condition:
+            self._pending = text
+            self._deadline = deadline = time.monotonic() + self.delay
+        if self.delay > 0:
+            _schedule(self, deadline)
+            return True
+        return self.flush()
+
+    def flush(self):
+        """立即写入尚未写入的内容，返回是否成功"""
+        with self._condition:
+            while self._writing:
+                self._condition.wait()
+            text, self._pending = self._pending, None
+            if text is None:
+                return True
+            self._writing = True
+        return self._write(text)
+
+    def _write_due(self):
+        """由后台线程调用：最后一次保存之后已过 delay 秒时写入"""
+        with self._condition:
+            while self._writing:
+                self._condition.wait()
+            if self._pending is None:
+                return  # 已由 flush 写入
+            if self._deadline > time.monotonic():
+                retry = self._deadline
+            else:
+                text, self._pending = self._pending, None
+                self._writing = True
+                retry = None
+
+        if retry is None:
+            if self._write(text):
+                return
+            with self._condition:
+                # 写入失败且没有更新的内容时，稍后重试
+                if self._pending is not None:
+                    return
+                self._pending = text
+                self._deadline = retry = time.monotonic() + max(self.delay, 1.0)
+        _schedule(self, retry)
+
+    def _write(self, text):
+        """写入文件（调用前需已把 _writing 置为 True）"""
+        try:
+            write_atomic(self.path, text)
+            self.writes += 1
+            return True
+        except OSError as e:
+            print(f"保存用户信息失败: {e}")
+            return False
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class JsonProfileStore:
+    """单个 JSON 文件中的用户信息（保存经 ProfileWriter 合并、原子写入）"""
+
+    def __init__(self, path="user_info.json", delay=SAVE_DELAY):
+        self.path = path
+        self.writer = ProfileWriter(path, delay)
+
+    def load(self, user_id=DEFAULT_USER):
+        """读取用户信息，文件不存在时返回 None；文件已损坏时保留一份 .corrupt 副本并返回 None"""
+        self.writer.flush()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            print(f"用户信息文件已损坏，已备份为 {self.path}.corrupt: {e}")
+            try:
+                os.replace(self.path, f"{self.path}.corrupt")
+            except OSError:
+                pass
+            return None
+
+    def save(self, user_id, profile, fields=None):
+        """保存用户信息（文件只能整体写入，忽略 fields）"""
+        return self.writer.save(profile)
+
+    def flush(self):
+        return self.writer.flush()
+
+    def close(self):
+        self.writer.flush()
+
+
+class SQLiteProfileStore:
+    """SQLite 中的多用户信息
+
+    以 user_id 为主键（WITHOUT ROWID 表即按 user_id 组织的 B 树），按 ID 查找
+    为 O(log n)；每次保存都在一个事务中完成，多个进程同时修改同一用户时
+    只更新各自指定的字段，互不覆盖。
+    """
+
+    def __init__(self, path, timeout=5.0):
+        import sqlite3
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            "user_id TEXT PRIMARY KEY, level TEXT NOT NULL, expire_date TEXT, "
+            "join_date TEXT, theme TEXT NOT NULL) WITHOUT ROWID"
+        )
+
+    def load(self, user_id=DEFAULT_USER):
+        """读取用户信息，不存在时返回 None"""
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(PROFILE_FIELDS)} FROM profiles WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return dict(zip(PROFILE_FIELDS, row)) if row is not None else None
+
+    def save(self, user_id, profile, fields=None):
+        """在一个事务中保存用户信息；用户不存在时插入完整的一行"""
+        if fields is not None and not set(fields) <= set(PROFILE_FIELDS):
+            raise ValueError(f"未知的用户信息字段: {sorted(set(fields) - set(PROFILE_FIELDS))}")
+
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                updated = 0
+                if fields:
+                    assignments = ", ".join(f"{field} = ?" for field in fields)
+                    updated = self.connection.execute(
+                        f"UPDATE profiles SET {assignments} WHERE user_id = ?",
+                        [profile.get(field) for field in fields] + [user_id]
+                    ).rowcount
+                if not updated:
+                    self.connection.execute(
+                        f"INSERT OR REPLACE INTO profiles (user_id, {', '.join(PROFILE_FIELDS)}) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [user_id] + [profile.get(field) for field in PROFILE_FIELDS]
+                    )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+        return True
+
+    def user_ids(self):
+        """全部用户 ID（按 ID 排序）"""
+        with self.lock:
+            return [row[0] for row in self.connection.execute("SELECT user_id FROM profiles ORDER BY user_id")]
+
+    def flush(self):
+        return True  # 每次保存都已提交
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
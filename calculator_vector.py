@@ -0,0 +1,147 @@
+"""Intelligence Calculator 向量化批量计算
+
+依赖 NumPy（可选依赖，只有使用本模块时才需要安装）。对整列操作数一次性
+完成权限检查和加减运算，不逐行调用 Python 代码：
+
+    result, errors = evaluate_arrays(a, b, "+", "Max")
+    result, errors = evaluate_records(records, "Max")
+
+计算统一使用 float64（与 float 后端一致）；需要精确结果时请使用
+calculator_engine.evaluate_batch 和 decimal / fraction 后端。
+"""
+
+import numpy as np
+
+from calculator_engine import LEVELS
+
+
+# 逐行错误码
+OK = 0
+ERROR_PERMISSION = 1  # 操作数超出等级限额
+ERROR_OPERATOR = 2  # 不支持的运算符
+ERROR_INVALID = 3  # 操作数不是有限数（nan、inf）
+
+ERROR_MESSAGES = {
+    OK: "",
+    ERROR_PERMISSION: "权限错误: 超出当前版本的计算范围，请升级到更高级别！",
+    ERROR_OPERATOR: "错误：只支持加法和减法，请使用 + 或 -",
+    ERROR_INVALID: "错误：请输入有效的数字",
+}
+
+# evaluate_records 使用的结构化数组类型：(运算符, 操作数1, 操作数2)
+OPERATION_DTYPE = np.dtype([("op", "S1"), ("a", "f8"), ("b", "f8")])
+
+# 分块计算的行数：每块的临时数组都留在 CPU 缓存中，不必为整列分配临时数组
+BLOCK_ROWS = 1 << 16
+
+# 运算符的字符编码，'+' 为 43、'-' 为 45，44 - 编码即为 b 的符号
+_SIGN_BASE = 44
+
+
+def _operator_codes(op, shape):
+    """把运算符转换为字符编码：单个运算符返回整数，运算符数组返回编码数组（不复制）"""
+    op = np.asarray(op)
+    if op.ndim == 0:
+        op = op.item()
+        if isinstance(op, bytes):
+            op = op.decode()
+        return ord(op) if len(op) == 1 else 0
+
+    if op.shape != shape:
+        raise ValueError(f"运算符数组的形状与操作数不一致: {op.shape} 与 {shape}")
+    if op.dtype == np.dtype("S1"):
+        return op.view(np.uint8)
+    if op.dtype == np.dtype("U1"):
+        return op.view(np.uint32)
+    raise TypeError(f"运算符数组必须是单字符字符串类型（S1 或 U1），而不是 {op.dtype}")
+
+
+def evaluate_arrays(a, b, op='+', tier="Plus", levels=LEVELS):
+    """向量化计算 a op b，返回 (结果数组, 错误码数组)
+
+    op 可以是 '+' / '-'，也可以是与操作数形状相同的运算符数组。与 float 后端
+    一样拒绝 nan、inf 等非有限操作数；权限检查与 check_permission 相同：任一
+    操作数的绝对值超过等级限额即拒绝。出错的行结果为 nan，错误码见 ERROR_MESSAGES。
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if a.shape != b.shape:
+        raise ValueError(f"操作数数组的形状不一致: {a.shape} 与 {b.shape}")
+
+    shape = a.shape
+    codes = _operator_codes(op, shape)
+    a, b = a.reshape(-1), b.reshape(-1)
+    if isinstance(codes, int):
+        if abs(_SIGN_BASE - codes) != 1:
+            return np.full(shape, np.nan), np.full(shape, ERROR_OPERATOR, dtype=np.int8)
+    else:
+        codes = codes.reshape(-1)
+
+    result = np.empty(a.size)
+    errors = np.zeros(a.size, dtype=np.int8)
+
+    max_num = levels[tier]["max_number"]
+    limited = max_num != float('inf')
+
+    block = min(BLOCK_ROWS, a.size)
+    magnitude, other, denied = np.empty(block), np.empty(block), np.empty(block, dtype=bool)
+    finite, other_finite = np.empty(block, dtype=bool), np.empty(block, dtype=bool)
+
+    for start in range(0, a.size, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, a.size)
+        rows = stop - start
+        a_block, b_block, out = a[start:stop], b[start:stop], result[start:stop]
+
+        # a - b 与 a + (-b) 在浮点运算中结果完全相同，逐行运算符只需给 b 乘上符号
+        invalid = None
+        if isinstance(codes, int):
+            if _SIGN_BASE - codes == 1:
+                np.add(a_block, b_block, out=out)
+            else:
+                np.subtract(a_block, b_block, out=out)
+        else:
+            sign = np.subtract(_SIGN_BASE, codes[start:stop], dtype=np.int64)
+            np.multiply(b_block, sign, out=out)
+            np.add(a_block, out, out=out)
+            invalid = np.abs(sign) != 1
+
+        # nan 与限额比较总是 False，inf 在 So Big 等级也不超限，因此先找出非有限的操作数
+        block_finite = finite[:rows]
+        np.isfinite(a_block, out=block_finite)
+        np.logical_and(block_finite, np.isfinite(b_block, out=other_finite[:rows]), out=block_finite)
+        all_finite = block_finite.all()
+
+        # |a| > max 或 |b| > max，即 max(|a|, |b|) > max（只检查有限的操作数）
+        if limited:
+            block_magnitude, block_denied = magnitude[:rows], denied[:rows]
+            np.abs(a_block, out=block_magnitude)
+            np.maximum(block_magnitude, np.abs(b_block, out=other[:rows]), out=block_magnitude)
+            np.greater(block_magnitude, max_num, out=block_denied)
+            if not all_finite:
+                np.logical_and(block_denied, block_finite, out=block_denied)
+            if block_denied.any():
+                errors[start:stop] = block_denied  # ERROR_PERMISSION 为 1
+                np.copyto(out, np.nan, where=block_denied)
+
+        # 无效数字先于权限报错（与逐个计算时先解析操作数的顺序一致）
+        if not all_finite:
+            nonfinite = ~block_finite
+            errors[start:stop][nonfinite] = ERROR_INVALID
+            out[nonfinite] = np.nan
+
+        # 运算符无效时先于权限报错（与逐个计算时的顺序一致）
+        if invalid is not None and invalid.any():
+            errors[start:stop][invalid] = ERROR_OPERATOR
+            out[invalid] = np.nan
+
+    return result.reshape(shape), errors.reshape(shape)
+
+
+def evaluate_records(records, tier="Plus", levels=LEVELS):
+    """计算含 op / a / b 字段的结构化数组（如 OPERATION_DTYPE），返回 (结果数组, 错误码数组)"""
+    return evaluate_arrays(records["a"], records["b"], records["op"], tier, levels)
+
+
+def calculate_arrays(a, b, op, user_manager):
+    """按用户当前等级向量化计算，返回 (结果数组, 错误码数组)"""
+    return evaluate_arrays(a, b, op, user_manager.get_current_level(), user_manager.levels)
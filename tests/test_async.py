@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from calculator_engine import CalculationError, PermissionDenied, derive_stream, render_transcript
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def test_instant_stream_matches_transcript():
+    chunks = asyncio.run(collect(derive_stream("1+1", pace="instant")))
+    assert chunks == [render_transcript("+", 1.0, 1.0)]
+
+
+def test_paced_stream_yields_frames():
+    chunks = asyncio.run(collect(derive_stream("1-2", pace="scaled:0.001", frame_interval=0.001)))
+    assert len(chunks) > 1
+    assert "".join(chunks) == render_transcript("-", 1.0, 2.0)
+
+
+def test_errors_raise_on_first_iteration():
+    with pytest.raises(PermissionDenied):
+        asyncio.run(collect(derive_stream("20+1", "Plus", pace="instant")))
+    with pytest.raises(CalculationError):
+        asyncio.run(collect(derive_stream("nan+1", pace="instant")))
+
+
+def test_invalid_pace():
+    with pytest.raises(ValueError):
+        asyncio.run(collect(derive_stream("1+1", pace="scaled:inf")))
+
+
+def test_many_streams_share_one_loop():
+    async def main():
+        streams = [collect(derive_stream(f"{i % 10}+1", pace="scaled:0.001")) for i in range(200)]
+        return await asyncio.gather(*streams)
+
+    results = asyncio.run(main())
+    assert all("最终结论" in "".join(chunks) for chunks in results)
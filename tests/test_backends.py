@@ -0,0 +1,104 @@
+import decimal
+from fractions import Fraction
+
+import pytest
+
+from calculator_engine import CalculationError, DecimalBackend, FractionBackend, PermissionDenied, evaluate, \
+    evaluate_batch, get_backend, render_batch
+
+
+def test_tier_default_backends():
+    assert get_backend(tier="Plus").name == "float"
+    assert get_backend(tier="So Big").name == "decimal"
+    assert get_backend("fraction") is get_backend("fraction")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_backend("complex")
+
+
+def test_decimal_is_exact():
+    backend = get_backend("decimal")
+    assert backend.format(evaluate("0.1+0.2", "So Big").value) == "0.3"
+
+
+def test_decimal_exact_overflow_is_calculation_error():
+    with pytest.raises(CalculationError):
+        evaluate("1e999999999+1", "So Big")
+
+
+def test_decimal_custom_context_rounds():
+    backend = DecimalBackend(decimal.Context(prec=5))
+    assert evaluate("1.234567+0", "Plus", backend).value == decimal.Decimal("1.2346")
+    assert backend.key != get_backend("decimal").key
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1+2", "3"),
+    ("0.1+0.2", "0.3"),
+    ("3/4+1", "1.75"),
+    ("1/3+1", "4/3"),
+    ("1/3-1", "-2/3"),
+    ("-0.05+0", "-0.05"),
+])
+def test_fraction(text, expected):
+    backend = get_backend("fraction")
+    assert backend.format(evaluate(text, "Max", backend).value) == expected
+
+
+@pytest.mark.parametrize("backend", ["float", "fraction", "decimal", DecimalBackend(decimal.Context(prec=5))])
+@pytest.mark.parametrize("operand", ["nan", "NaN", "inf", "-inf", "Infinity", "snan"])
+def test_non_finite_operands_rejected(backend, operand):
+    with pytest.raises(CalculationError) as exc_info:
+        evaluate(f"{operand}+1", "Plus", backend)
+    assert not isinstance(exc_info.value, PermissionDenied)
+
+
+@pytest.mark.parametrize("backend", ["float", "decimal", DecimalBackend(decimal.Context(prec=5))])
+def test_non_finite_does_not_stop_batch(backend):
+    results = evaluate_batch(["nan+1", "inf-1", "1+1"], "Plus", backend=backend)
+    assert [item.error == "" for item in results] == [False, False, True]
+
+    transcripts = list(render_batch(["nan+1", "1+1"], "Plus", backend, workers=1))
+    assert transcripts[0].error and transcripts[1].text
+
+
+@pytest.mark.parametrize("backend", ["decimal", "fraction"])
+def test_huge_exponent_checked_against_tier(backend):
+    with pytest.raises(PermissionDenied):
+        evaluate("1e99999+1", "Plus", backend)
+
+
+@pytest.mark.parametrize("text", ["1e999999999+1", "1e-999999999+1", "1E1000001+0"])
+def test_fraction_huge_exponent_rejected_before_building(text):
+    with pytest.raises(CalculationError, match="位数超出范围"):
+        evaluate(text, "So Big", "fraction")
+
+
+def test_fraction_exponent_at_limit():
+    value = FractionBackend().parse("1e1000")
+    assert value == Fraction(10) ** 1000
+
+
+def test_decimal_overflowing_exponent_denied_not_crashing():
+    results = evaluate_batch(["1e999999999+1", "1+1"], "Plus", backend="decimal")
+    assert results[0].allowed is False
+    assert results[1].result.value == 2
+
+
+def test_fraction_beyond_int_string_limit():
+    nines = "9" * 5000
+    backend = get_backend("fraction")
+    assert backend.parse(nines) == 10 ** 5000 - 1
+    result = evaluate(f"{nines}+{nines}", "So Big", backend)
+    assert backend.format(result.value) == "1" + "9" * 4999 + "8"
+    assert backend.format(backend.parse(f"{nines}.5")).endswith("9.5")
+    assert backend.format(backend.parse(f"1/{nines}")) == f"1/{nines}"
+
+
+def test_fraction_beyond_int_string_limit_in_batch():
+    nines = "9" * 5000
+    transcripts = list(render_batch([f"{nines}+1", "1+1"], "So Big", "fraction", workers=1))
+    assert not transcripts[0].error and "1" + "0" * 5000 in transcripts[0].text
+    assert transcripts[1].text
@@ -0,0 +1,30 @@
+from calculator_engine import evaluate_batch, iter_evaluate
+
+
+def test_batch_keeps_order_and_reports_per_item_errors():
+    results = evaluate_batch(["1+1", "bad", "20+1", "3-4"], "Plus")
+
+    assert [item.expression for item in results] == ["1+1", "bad", "20+1", "3-4"]
+    assert results[0].result.value == 2 and results[0].allowed is True and results[0].error == ""
+    assert results[1].result is None and results[1].allowed is None and results[1].error
+    assert results[2].result is None and results[2].allowed is False and results[2].error.startswith("权限错误")
+    assert results[3].result.value == -1
+
+
+def test_batch_custom_permission():
+    deny_subtraction = lambda a, b, operator: (operator == "+", "不支持减法")
+    results = evaluate_batch(["1+1", "1-1"], can_calculate=deny_subtraction)
+    assert [item.allowed for item in results] == [True, False]
+    assert results[1].error == "权限错误: 不支持减法"
+
+
+def test_iter_evaluate_is_lazy():
+    def expressions():
+        yield "1+1"
+        raise AssertionError("不应读取下一个表达式")
+
+    assert next(iter_evaluate(expressions())).result.value == 2
+
+
+def test_empty_batch():
+    assert evaluate_batch([]) == []
@@ -0,0 +1,129 @@
+import sqlite3
+
+import pytest
+
+from calculator_cache import CacheEntry, ResultCache, SQLiteStore
+from calculator_engine import CalculationError, PermissionDenied, check_permission
+
+
+def tier(level):
+    return lambda a, b, operator: check_permission(level, a, b)
+
+
+def entry(text, size=10):
+    return CacheEntry(text, text, "x" * size)
+
+
+def test_hit_after_normalized_miss():
+    cache = ResultCache()
+    first = cache.calculate("1+1", tier("Plus"))
+    assert cache.calculate(" 1 + +1 ", tier("Plus")) == first
+    assert first.result == "2.0" and "最终结论" in first.transcript
+    assert cache.stats()[:3] == (1, 0, 1)
+
+
+def test_permission_is_rechecked_on_hit():
+    cache = ResultCache()
+    cache.calculate("50+1", tier("Pro"))
+    with pytest.raises(PermissionDenied):
+        cache.calculate("50+1", tier("Plus"))
+
+
+def test_errors_are_not_cached():
+    cache = ResultCache()
+    for expression in ("bad", "nan+1"):
+        with pytest.raises(CalculationError):
+            cache.calculate(expression, tier("Plus"))
+    assert cache.stats().size == 0
+
+
+def test_backends_do_not_share_entries():
+    cache = ResultCache()
+    assert cache.calculate("0.1+0.2", tier("So Big"), "float").result != \
+        cache.calculate("0.1+0.2", tier("So Big"), "decimal").result
+
+
+def test_count_limit_evicts_least_recently_used():
+    cache = ResultCache(maxsize=2)
+    cache.put("a", entry("a"))
+    cache.put("b", entry("b"))
+    cache.get("a")
+    cache.put("c", entry("c"))
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.stats().evictions == 1
+
+
+def test_character_limit():
+    cache = ResultCache(max_chars=1600)
+    for key in "abcdef":
+        cache.put(key, entry(key, 98))  # 每个条目 100 个字符
+    assert cache.chars == 600
+
+    cache.put("g", entry("g", 2000))  # 超过上限的 1/16，不放入内存
+    assert "g" not in cache.entries
+
+    for key in "hijklmnopqr":
+        cache.put(key, entry(key, 98))
+    assert cache.chars <= 1600 and list(cache.entries)[-1] == "r"
+
+    cache.put("r", entry("r", 8))
+    assert cache.chars == sum(len(e.expression) + len(e.result) + len(e.transcript) for e in cache.entries.values())
+
+
+def test_huge_result_not_kept_in_memory():
+    cache = ResultCache(max_chars=16 * 1024)
+    cache.calculate("9" * 2000 + "+1", tier("So Big"), "decimal")
+    assert cache.stats().size == 0 and cache.chars == 0
+
+
+def test_sqlite_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResultCache(store=SQLiteStore(path))
+    cache.calculate("1+2", tier("Plus"))
+    cache.close()
+
+    cache = ResultCache(store=SQLiteStore(path))
+    assert cache.calculate("1+2", tier("Plus")).result == "3.0"
+    assert cache.stats().disk_hits == 1
+    cache.close()
+
+
+def test_sqlite_evicts_least_recently_used(tmp_path):
+    store = SQLiteStore(str(tmp_path / "cache.sqlite3"), max_rows=10)
+    for i in range(10):
+        store.put(("float", str(i)), entry(str(i)))
+    store.get(("float", "0"))  # 最早写入但最近使用
+    store.put(("float", "new"), entry("new"))
+
+    assert store.get(("float", "0")) is not None
+    assert store.get(("float", "1")) is None
+    assert store.get(("float", "new")) is not None
+    store.close()
+
+
+def test_sqlite_replacing_entries_does_not_evict(tmp_path):
+    store = SQLiteStore(str(tmp_path / "cache.sqlite3"), max_rows=10)
+    for i in range(10):
+        store.put(("float", str(i)), entry(str(i)))
+    for _ in range(5):
+        store.put(("float", "0"), entry("0"))
+
+    assert store.rows == 10
+    assert all(store.get(("float", str(i))) is not None for i in range(10))
+    store.close()
+
+
+def test_sqlite_upgrades_old_schema(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE results (backend TEXT NOT NULL, expression TEXT NOT NULL, display TEXT NOT NULL, "
+        "result TEXT NOT NULL, transcript BLOB NOT NULL, PRIMARY KEY (backend, expression))"
+    )
+    connection.commit()
+    connection.close()
+
+    store = SQLiteStore(path)
+    store.put(("float", "1+1"), entry("1+1"))
+    assert store.get(("float", "1+1")) == entry("1+1")
+    store.close()
@@ -0,0 +1,47 @@
+import time
+import threading
+
+import pytest
+
+from calculator_engine import CalculationCancelled, CancellationToken, Pacing, derive, play
+
+
+def test_sleep_is_interrupted():
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel).start()
+    start = time.monotonic()
+    with pytest.raises(CalculationCancelled):
+        token.sleep(10)
+    assert time.monotonic() - start < 5
+
+
+def test_check():
+    token = CancellationToken()
+    token.check()
+    token.cancel()
+    assert token.cancelled
+    with pytest.raises(CalculationCancelled):
+        token.check()
+
+
+def test_no_output_after_cancel():
+    token = CancellationToken()
+    written = []
+
+    def write(chunk):
+        written.append(chunk)
+        if len(written) == 2:
+            token.cancel()
+
+    with pytest.raises(CalculationCancelled):
+        play(derive("1+1"), Pacing.scaled(0.01), write, token)
+    assert len(written) == 2
+
+
+def test_cancelled_before_start_writes_nothing():
+    token = CancellationToken()
+    token.cancel()
+    written = []
+    with pytest.raises(CalculationCancelled):
+        play(derive("1+1"), Pacing.instant(), written.append, token)
+    assert written == []
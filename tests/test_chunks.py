@@ -0,0 +1,33 @@
+import pytest
+
+from calculator_engine import Pacing, Step, paced_chunks, play
+
+
+STEPS = [Step("abcdef", 0.5), Step("gh", 0)]
+
+
+def test_instant_is_one_chunk():
+    assert list(paced_chunks(STEPS, Pacing.instant())) == [("abcdef\ngh\n", 0)]
+
+
+def test_realtime_chunks_fill_a_frame():
+    chunks = list(paced_chunks(STEPS, Pacing.realtime(), frame_interval=0.06))
+
+    assert "".join(text for text, _ in chunks) == "abcdef\ngh\n"
+    # 每个字符 30ms，两个字符凑满一帧
+    assert chunks[0] == ("ab", pytest.approx(0.06))
+    # 步骤后的停顿并入该块的等待时间
+    assert chunks[3] == ("\n", pytest.approx(0.5))
+
+
+def test_total_delay_matches_character_pacing():
+    pacing = Pacing.scaled(0.5)
+    chunks = list(paced_chunks(STEPS, pacing))
+    expected = 8 * pacing.char_delay + pacing.pause(0.5)
+    assert sum(delay for _, delay in chunks) == pytest.approx(expected)
+
+
+def test_play_writes_every_chunk():
+    written = []
+    play(STEPS, Pacing.instant(), written.append)
+    assert written == ["abcdef\ngh\n"]
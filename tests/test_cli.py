@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+import calculator_cli
+
+
+def run(argv, stdin=""):
+    out, err = io.StringIO(), io.StringIO()
+    code = calculator_cli.main(argv, io.StringIO(stdin), out, err)
+    return code, out.getvalue(), err.getvalue()
+
+
+def test_wants_cli():
+    assert calculator_cli.wants_cli(["--eval", "1+1"])
+    assert calculator_cli.wants_cli(["--stdin=1"])
+    assert not calculator_cli.wants_cli(["--pace", "fast"])
+
+
+def test_eval_and_stdin():
+    code, out, err = run(["--eval", "1+1", "--stdin"], "2-3\n\n")
+    assert (code, out, err) == (0, "1.0 + 1.0 = 2.0\n2.0 - 3.0 = -1.0\n", "")
+
+
+def test_failures_do_not_stop_later_items():
+    code, out, err = run(["--eval", "20+1", "--eval", "1+1"])
+    assert code == 1
+    assert out == "1.0 + 1.0 = 2.0\n"
+    assert err.startswith("20+1: 权限错误")
+
+
+def test_derive_instant():
+    code, out, _ = run(["--eval", "1+1", "--derive"])
+    assert code == 0 and out.startswith("开始计算 1.0 + 1.0 ...\n")
+
+
+def test_invalid_pace_is_usage_error():
+    with pytest.raises(SystemExit) as exc_info:
+        calculator_cli.parse_args(["--pace", "scaled:inf"])
+    assert exc_info.value.code == 2
+
+
+@pytest.mark.parametrize("jobs", ["-1", "x"])
+def test_invalid_jobs_is_usage_error(jobs):
+    with pytest.raises(SystemExit) as exc_info:
+        calculator_cli.parse_args(["--jobs", jobs])
+    assert exc_info.value.code == 2
+
+
+@pytest.mark.parametrize("precision", ["0", "-3", "x"])
+def test_invalid_precision_is_usage_error(precision):
+    with pytest.raises(SystemExit) as exc_info:
+        calculator_cli.parse_args(["--precision", precision])
+    assert exc_info.value.code == 2
+
+
+def test_parallel_derive():
+    code, out, err = run(["--stdin", "--derive", "--jobs", "2"], "1+1\nbad\n2+2\n")
+    assert code == 1
+    assert out.count("最终结论") == 2 and out.index("1.0 + 1.0 = 2.0") < out.index("2.0 + 2.0 = 4.0")
+    assert err.startswith("bad: ")
@@ -0,0 +1,46 @@
+import pytest
+
+from calculator_engine import CalculationError, PermissionDenied, check_permission, derive, evaluate
+
+
+def test_evaluate_addition_and_subtraction():
+    assert evaluate("1+1").value == 2
+    assert evaluate("5-3", "Max").value == 2
+
+
+def test_evaluate_records_operations():
+    result = evaluate("1+2-3", "Pro")
+    assert result.operands == (1, 2, 3)
+    assert [(op.operator, op.a, op.b, op.value) for op in result.operations] == [("+", 1, 2, 3), ("-", 3, 3, 0)]
+    assert result.value == 0
+
+
+@pytest.mark.parametrize("tier, allowed", [("Plus", False), ("Pro", True), ("So Big", True)])
+def test_check_permission_tiers(tier, allowed):
+    assert check_permission(tier, 50, 1)[0] is allowed
+
+
+def test_check_permission_uses_absolute_value():
+    assert check_permission("Plus", -10, 10) == (True, "")
+    assert check_permission("Plus", -11, 1)[0] is False
+
+
+def test_evaluate_denied_above_tier_limit():
+    with pytest.raises(PermissionDenied):
+        evaluate("11+1", "Plus")
+
+
+@pytest.mark.parametrize("expression", ["", "1", "abc+1", "1*2", "1+"])
+def test_evaluate_invalid(expression):
+    with pytest.raises(CalculationError):
+        evaluate(expression)
+
+
+def test_derive_ends_with_conclusion():
+    steps = list(derive("1+1"))
+    assert steps[0].text == "开始计算 1.0 + 1.0 ..."
+    assert "最终结论：1.0 + 1.0 = 2.0" in [step.text for step in steps]
+
+
+def test_derive_skips_permission_check():
+    assert any("100.0 - 1.0 = 99.0" in step.text for step in derive("100-1"))
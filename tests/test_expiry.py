@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from calculator_core import ThemeManager, UserManager
+from calculator_storage import UserProfile, format_date
+
+
+def test_profile_round_trip():
+    data = {"level": "Max", "expire_date": "2099-01-02 03:04:05", "join_date": "2026-01-01 00:00:00",
+            "theme": "light"}
+    profile = UserProfile.from_dict(data)
+    assert profile.to_dict() == data
+    assert profile["expire_date"] == data["expire_date"] and profile.get("missing", 1) == 1
+    with pytest.raises(KeyError):
+        profile["password"] = "x"
+
+
+def test_seconds_left_and_expired():
+    profile = UserProfile("Pro", expire_at=1000.0)
+    assert profile.seconds_left(now=400.0) == 600.0
+    assert not profile.expired(now=1000.0)
+    assert profile.expired(now=1000.5)
+    assert UserProfile().seconds_left() is None and not UserProfile().expired()
+
+
+@pytest.fixture
+def user(tmp_path):
+    return UserManager(ThemeManager(), str(tmp_path / "user_info.json"), save_delay=0)
+
+
+def test_check_expiry_demotes_and_resets_theme(user):
+    user.upgrade_user("Ultra")
+    assert user.set_theme("dark")
+    assert not user.check_expiry()
+
+    user.current_user.expire_at = time.time() - 1
+    assert user.check_expiry()
+    assert (user.get_current_level(), user.current_user.theme, user.expire_in()) == ("Plus", "light", None)
+
+
+def test_expired_file_demoted_on_load(tmp_path):
+    path = tmp_path / "user_info.json"
+    user = UserManager(ThemeManager(), str(path), save_delay=0)
+    user.upgrade_user("Max")
+    user.current_user.expire_at = time.time() - 60
+    user.save_user_info()
+
+    assert UserManager(ThemeManager(), str(path), save_delay=0).get_current_level() == "Plus"
+
+
+def test_expire_in_and_days(user):
+    user.upgrade_user("Pro")
+    assert 29 * 86400 < user.expire_in() <= 30 * 86400 + 1  # 到期时间精确到秒
+    assert user.get_expire_days() in (29, 30)
+    assert not user.check_expire_soon()
+
+    user.current_user.expire_date = format_date(time.time() + 3 * 86400)
+    assert user.check_expire_soon()
@@ -0,0 +1,39 @@
+import math
+
+import pytest
+
+from calculator_engine import Pacing
+
+
+@pytest.mark.parametrize("text, factor", [
+    ("instant", 0),
+    ("realtime", 1),
+    ("fast", 0.25),
+    ("scaled:0.5", 0.5),
+    (" Scaled:2 ", 2),
+    ("0.1", 0.1),
+])
+def test_parse(text, factor):
+    assert Pacing.parse(text).factor == factor
+
+
+def test_name_round_trip():
+    for text in ("instant", "realtime", "fast", "scaled:3"):
+        assert Pacing.parse(text).name == text
+
+
+@pytest.mark.parametrize("text", ["inf", "scaled:inf", "-inf", "nan", "scaled:nan", "-1", "scaled:1e9", "abc", ""])
+def test_parse_rejects(text):
+    with pytest.raises(ValueError):
+        Pacing.parse(text)
+
+
+@pytest.mark.parametrize("factor", [math.inf, math.nan, -0.5, Pacing.MAX_FACTOR + 1])
+def test_constructor_rejects(factor):
+    with pytest.raises(ValueError):
+        Pacing(factor)
+
+
+def test_max_factor_allowed():
+    pacing = Pacing.scaled(Pacing.MAX_FACTOR)
+    assert pacing.char_delay == Pacing.CHAR_DELAY * Pacing.MAX_FACTOR
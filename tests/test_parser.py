@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from calculator_engine import BinaryOp, CalculationError, Negate, Number, normalize, parse, parse_operands
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_binary_fast_path():
+    assert parse(" 12 +  3.5 ") == BinaryOp("+", Number("12"), Number("3.5"))
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("12+3", BinaryOp("+", Number("12"), Number("3"))),
+    ("007-8", BinaryOp("-", Number("007"), Number("8"))),
+    ("1-2-3", BinaryOp("-", BinaryOp("-", Number("1"), Number("2")), Number("3"))),
+    ("1+-2", BinaryOp("+", Number("1"), Negate(Number("2")))),
+    ("\uff11+2", BinaryOp("+", Number("\uff11"), Number("2"))),
+])
+def test_integer_fast_path_matches_general_parser(expression, expected):
+    tree = parse(expression)
+    assert tree == expected
+    assert type(tree) is BinaryOp and type(tree.right) is type(expected.right)
+
+
+def test_left_associative_chain():
+    assert parse("1-2+3") == BinaryOp("+", BinaryOp("-", Number("1"), Number("2")), Number("3"))
+
+
+def test_unary_signs():
+    assert parse("-1 - -2") == BinaryOp("-", Negate(Number("1")), Negate(Number("2")))
+    assert parse("+1+--2") == BinaryOp("+", Number("1"), Negate(Negate(Number("2"))))
+
+
+@pytest.mark.parametrize("expression, normalized", [
+    ("-1e2 + 5 - 3", "-1e2+5-3"),
+    ("1E+3-.5", "1E+3-.5"),
+    ("1_000 + 2", "1_000+2"),
+    ("+ 1 + + 2", "1+2"),
+    ("3/4 + 1", "3/4+1"),
+])
+def test_normalize(expression, normalized):
+    assert normalize(expression) == normalized
+
+
+def test_parse_operands():
+    assert parse_operands("-1e2 + 5 - -3") == (("+", "-"), (-100.0, 5.0, -3.0))
+
+
+@pytest.mark.parametrize("expression", ["", "   ", "5", "-5", "1 2+3", "1+", "+", "1++", "1+2-"])
+def test_invalid_syntax(expression):
+    with pytest.raises(CalculationError):
+        parse(expression)
+
+
+@pytest.mark.parametrize("expression", ["1+abc", "1e+2e3", "1..2+1"])
+def test_invalid_numbers(expression):
+    with pytest.raises(CalculationError, match="有效的数字"):
+        parse_operands(expression)
+
+
+def test_import_does_not_load_re():
+    # re 在第一次解析时才导入（-S 跳过 site，避免启动过程本身加载 re）
+    code = "import sys, calculator_engine; print('re' in sys.modules)"
+    proc = subprocess.run([sys.executable, "-S", "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert proc.stdout.strip() == "False", proc.stderr
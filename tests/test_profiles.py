@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from calculator_core import ThemeManager, UserManager
+from calculator_storage import JsonProfileStore, SQLiteProfileStore, verify_profile
+
+
+PROFILE = {"level": "Pro", "expire_date": "2099-01-01 00:00:00", "join_date": "2026-01-01 00:00:00",
+           "theme": "light"}
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        store = JsonProfileStore(str(tmp_path / "user_info.json"), delay=0)
+    else:
+        store = SQLiteProfileStore(str(tmp_path / "users.sqlite3"))
+    yield store
+    store.close()
+
+
+def test_round_trip(store):
+    assert store.load("alice") is None
+    store.save("alice", PROFILE)
+    store.flush()
+    assert store.load("alice") == PROFILE
+
+
+def test_sqlite_partial_update_keeps_other_fields(tmp_path):
+    path = str(tmp_path / "users.sqlite3")
+    first, second = SQLiteProfileStore(path), SQLiteProfileStore(path)
+    first.save("alice", PROFILE)
+    second.save("alice", dict(PROFILE, level="Max", expire_date=None), fields=("level",))
+    first.save("alice", dict(PROFILE, theme="dark"), fields=("theme",))
+
+    assert first.load("alice") == dict(PROFILE, level="Max", theme="dark")
+    assert first.user_ids() == ["alice"]
+    with pytest.raises(ValueError):
+        first.save("alice", PROFILE, fields=("password",))
+    first.close()
+    second.close()
+
+
+def test_sqlite_users_are_independent(tmp_path):
+    store = SQLiteProfileStore(str(tmp_path / "users.sqlite3"))
+    alice = UserManager(ThemeManager(), store=store, user_id="alice")
+    bob = UserManager(ThemeManager(), store=store, user_id="bob")
+    assert alice.upgrade_user("Ultra")
+
+    assert UserManager(ThemeManager(), store=store, user_id="alice").get_current_level() == "Ultra"
+    assert UserManager(ThemeManager(), store=store, user_id="bob").get_current_level() == "Plus"
+    assert store.user_ids() == ["alice", "bob"] and bob.get_current_level() == "Plus"
+    store.close()
+
+
+@pytest.mark.parametrize("change, level, theme", [
+    ({"level": "Gold"}, "Plus", "light"),
+    ({"expire_date": "soon"}, "Plus", "light"),
+    ({"theme": "golden"}, "Pro", "light"),
+    ({}, "Pro", "light"),
+])
+def test_verify_profile(change, level, theme):
+    profile, problems = verify_profile(dict(PROFILE, **change))
+    assert (profile["level"], profile["theme"]) == (level, theme)
+    assert bool(problems) == bool(change)
+
+
+def test_corrupt_json_is_kept_aside(tmp_path):
+    path = tmp_path / "user_info.json"
+    path.write_text("{not json", encoding="utf-8")
+    user = UserManager(ThemeManager(), str(path), save_delay=0)
+
+    assert user.get_current_level() == "Plus"
+    assert (tmp_path / "user_info.json.corrupt").read_text(encoding="utf-8") == "{not json"
+    assert json.loads(path.read_text(encoding="utf-8"))["level"] == "Plus"
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from calculator_engine import render_batch, render_result, evaluate
+
+
+EXPRESSIONS = [f"{i % 10}+{i % 7}" for i in range(40)] + ["bad", "20-1"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ordered_transcripts(workers):
+    transcripts = list(render_batch(EXPRESSIONS, "Plus", workers=workers, chunk_size=8))
+
+    assert [t.index for t in transcripts] == list(range(len(EXPRESSIONS)))
+    assert transcripts[3].text == render_result(evaluate(EXPRESSIONS[3]))
+    assert transcripts[-2].text is None and transcripts[-2].error
+    assert transcripts[-1].error.startswith("权限错误")
+
+
+def test_unordered_can_be_restored():
+    transcripts = list(render_batch(EXPRESSIONS, "Plus", workers=2, chunk_size=4, ordered=False))
+    assert sorted(t.index for t in transcripts) == list(range(len(EXPRESSIONS)))
+
+
+def test_sink_receives_texts_in_order():
+    sink = io.StringIO()
+    transcripts = list(render_batch(EXPRESSIONS[:10], "Plus", workers=2, chunk_size=3, sink=sink))
+    assert sink.getvalue() == "".join(t.text for t in transcripts)
+
+
+def test_early_stop_shuts_pool_down():
+    batches = render_batch((f"{i % 10}+1" for i in range(10_000)), "Plus", workers=2, chunk_size=16)
+    first = next(batches)
+    batches.close()
+    assert first.index == 0
@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+from calculator_scheduler import CalculationScheduler, SchedulerFull
+
+
+@pytest.fixture
+def blocked():
+    """只有一个工作线程、被 gate 阻塞的调度器"""
+    scheduler = CalculationScheduler(workers=1, max_queue=3)
+    gate, started = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        gate.wait(5)
+
+    scheduler.submit(block)
+    started.wait(5)
+    yield scheduler, gate
+    gate.set()
+    scheduler.shutdown()
+
+
+def test_result_and_exception():
+    scheduler = CalculationScheduler(workers=2)
+    try:
+        assert scheduler.submit(lambda a, b: a + b, 1, b=2).result(5) == 3
+        with pytest.raises(ZeroDivisionError):
+            scheduler.submit(lambda: 1 / 0).result(5)
+    finally:
+        scheduler.shutdown()
+
+
+def test_higher_tier_runs_first(blocked):
+    scheduler, gate = blocked
+    order = []
+    futures = [scheduler.submit(order.append, level, level=level) for level in ("Plus", "So Big", "Pro")]
+    gate.set()
+    for future in futures:
+        future.result(5)
+    assert order == ["So Big", "Pro", "Plus"]
+
+
+def test_full_queue_rejects(blocked):
+    scheduler, _ = blocked
+    for _ in range(3):
+        scheduler.submit(lambda: None)
+    with pytest.raises(SchedulerFull):
+        scheduler.submit(lambda: None)
+    assert scheduler.metrics().rejected == 1
+
+
+def test_cancelled_entries_free_queue_slots(blocked):
+    scheduler, _ = blocked
+    futures = [scheduler.submit(lambda: None) for _ in range(3)]
+    assert futures[0].cancel()
+    scheduler.submit(lambda: None)
+    assert scheduler.metrics().queue_depth == 3
+
+
+def test_shutdown_cancels_pending(blocked):
+    scheduler, _ = blocked
+    pending = scheduler.submit(lambda: None)
+    scheduler.shutdown(wait=False)
+    assert pending.cancelled()
+    with pytest.raises(RuntimeError):
+        scheduler.submit(lambda: None)
+
+
+def test_cancelled_counted_once(blocked):
+    scheduler, _ = blocked
+    futures = [scheduler.submit(lambda: None) for _ in range(3)]
+    assert futures[0].cancel() and futures[0].cancel()
+    assert scheduler.metrics().cancelled == 1
+
+    scheduler.submit(lambda: None)  # 队列已满，移出已取消的任务
+    scheduler.shutdown(wait=False)
+    assert all(future.cancelled() for future in futures)
+    assert scheduler.metrics().cancelled == 4
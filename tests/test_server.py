@@ -0,0 +1,121 @@
+import json
+import time
+import asyncio
+import sqlite3
+
+import pytest
+
+from calculator_core import ThemeManager, UserManager
+import calculator_server
+from calculator_server import CalculatorServer
+
+
+@pytest.fixture
+def users(tmp_path):
+    plus = UserManager(ThemeManager(), str(tmp_path / "plus.json"), save_delay=0)
+    big = UserManager(ThemeManager(), str(tmp_path / "big.json"), save_delay=0)
+    big.upgrade_user("So Big")
+    return {"plus-key": plus, "big-key": big}
+
+
+def request(server, raw):
+    """启动服务，发送一个原始请求，返回 (状态码, 响应体)"""
+    async def main():
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            data = await reader.read()
+            writer.close()
+            return data
+        finally:
+            listener.close()
+            await listener.wait_closed()
+
+    head, _, body = asyncio.run(main()).partition(b"\r\n\r\n")
+    return int(head.split()[1]), body.decode("utf-8")
+
+
+def post(server, expression, key="plus-key"):
+    body = json.dumps({"expression": expression}).encode()
+    raw = (b"POST /calculate HTTP/1.1\r\nConnection: close\r\nX-API-Key: " + key.encode() +
+           b"\r\nContent-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+    status, text = request(server, raw)
+    return status, json.loads(text)
+
+
+def get(server, target):
+    return request(server, f"GET {target} HTTP/1.1\r\nConnection: close\r\n\r\n".encode())
+
+
+def test_calculate(users):
+    server = CalculatorServer(users)
+    assert post(server, "1+1") == (200, {"expression": "1.0 + 1.0", "result": "2.0", "level": "Plus"})
+    assert post(server, "0.1+0.2", "big-key")[1]["result"] == "0.3"
+
+
+@pytest.mark.parametrize("expression, key, status", [
+    ("20+1", "plus-key", 403),
+    ("nan+1", "plus-key", 400),
+    ("nan+1", "big-key", 400),
+    ("1*2", "plus-key", 400),
+    ("1+1", "wrong-key", 401),
+])
+def test_calculate_errors(users, expression, key, status):
+    assert post(CalculatorServer(users), expression, key)[0] == status
+
+
+def test_expired_membership_demoted_while_serving(users):
+    server = CalculatorServer(users)
+    assert post(server, "500+1", "big-key")[0] == 200
+
+    users["big-key"].current_user.expire_at = time.time() - 1
+    assert post(server, "500+1", "big-key")[0] == 403
+    assert post(server, "1+1", "big-key")[1]["level"] == "Plus"
+
+
+def test_derive_streams_events_then_result(users):
+    status, body = get(CalculatorServer(users), "/derive?expression=1%2B1&pace=instant&api_key=plus-key")
+    assert status == 200
+    assert "data: 最终结论：1.0 + 1.0 = 2.0" in body
+    assert body.rstrip().endswith('data: {"expression": "1.0 + 1.0", "result": "2.0", "level": "Plus"}')
+
+
+@pytest.mark.parametrize("pace", ["scaled:inf", "nan", "-1", "scaled:1000"])
+def test_derive_rejects_bad_pace(users, pace):
+    status, body = get(CalculatorServer(users), f"/derive?expression=1%2B1&pace={pace}&api_key=plus-key")
+    assert status == 400 and "error" in json.loads(body)
+
+
+def test_health_and_unknown_path(users):
+    server = CalculatorServer(users)
+    post(server, "1+1")
+    post(server, "1 + 1")
+    status, body = get(server, "/health")
+    assert status == 200 and json.loads(body)["cache"]["hits"] == 1
+    assert get(server, "/missing")[0] == 404
+
+
+def test_unexpected_error_returns_500(users, monkeypatch, capsys):
+    server = CalculatorServer(users)
+
+    def broken(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(server.cache, "calculate", broken)
+    assert post(server, "1+1") == (500, {"error": "服务器内部错误"})
+    assert "database is locked" in capsys.readouterr().err
+
+
+def test_unexpected_error_while_streaming_sends_error_event(users, monkeypatch, capsys):
+    async def broken_stream(*args, **kwargs):
+        yield "推导开始"
+        raise ValueError("无法格式化")
+
+    monkeypatch.setattr(calculator_server, "derive_stream", broken_stream)
+    status, body = get(CalculatorServer(users), "/derive?expression=1%2B1&pace=instant&api_key=plus-key")
+    assert status == 200
+    assert "data: 推导开始" in body and body.rstrip().endswith('event: error\ndata: {"error": "服务器内部错误"}')
+    assert "无法格式化" in capsys.readouterr().err
@@ -0,0 +1,106 @@
+import os
+import sys
+import json
+import stat
+import time
+import threading
+import subprocess
+
+import pytest
+
+from calculator_storage import ProfileWriter, write_atomic
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_write_atomic_replaces_content(tmp_path):
+    path = str(tmp_path / "user_info.json")
+    write_atomic(path, "old")
+    write_atomic(path, "new")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "new"
+    assert os.listdir(tmp_path) == ["user_info.json"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="需要 POSIX 权限位")
+def test_write_atomic_keeps_existing_mode(tmp_path):
+    path = str(tmp_path / "user_info.json")
+    write_atomic(path, "{}")
+    os.chmod(path, 0o644)
+    write_atomic(path, "{}")
+    assert mode(path) == 0o644
+
+    os.chmod(path, 0o640)
+    write_atomic(path, "{}")
+    assert mode(path) == 0o640
+
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="需要 POSIX 权限位")
+def test_write_atomic_new_file_follows_umask(tmp_path):
+    previous = os.umask(0o027)
+    try:
+        write_atomic(str(tmp_path / "new.json"), "{}")
+    finally:
+        os.umask(previous)
+    assert mode(tmp_path / "new.json") == 0o640
+
+
+def test_failed_write_leaves_old_file(tmp_path):
+    path = str(tmp_path / "user_info.json")
+    write_atomic(path, json.dumps({"level": "Pro"}))
+    with pytest.raises(TypeError):
+        write_atomic(path, None)
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"level": "Pro"}
+    assert os.listdir(tmp_path) == ["user_info.json"]
+
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_writer_coalesces_saves(tmp_path):
+    path = str(tmp_path / "user_info.json")
+    writer = ProfileWriter(path, delay=0.05)
+    for i in range(50):
+        writer.save({"theme": i})
+    assert writer.flush()
+    assert writer.writes == 1 and read_json(path) == {"theme": 49}
+
+
+def test_writer_background_write(tmp_path):
+    path = str(tmp_path / "user_info.json")
+    writer = ProfileWriter(path, delay=0.01)
+    writer.save({"level": "Pro"})
+    deadline = time.monotonic() + 5
+    while writer.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read_json(path) == {"level": "Pro"}
+
+
+def test_writers_share_one_thread(tmp_path):
+    writers = [ProfileWriter(str(tmp_path / f"{i}.json"), delay=0.01) for i in range(20)]
+    for i, writer in enumerate(writers):
+        writer.save({"id": i})
+    threads = [thread for thread in threading.enumerate() if thread.name == "profile-writer"]
+    assert len(threads) == 1
+
+    deadline = time.monotonic() + 5
+    while any(writer.writes == 0 for writer in writers) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [read_json(writer.path) for writer in writers] == [{"id": i} for i in range(20)]
+
+
+def test_pending_saves_written_at_exit(tmp_path):
+    path = str(tmp_path / "user_info.json")
+    code = (
+        "from calculator_storage import ProfileWriter\n"
+        f"for i in range(3): ProfileWriter({path!r} + str(i), delay=60).save({{'n': i}})\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+    assert [read_json(path + str(i)) for i in range(3)] == [{"n": i} for i in range(3)]
@@ -0,0 +1,64 @@
+import io
+
+import pytest
+
+from calculator_engine import CalculationError, stream_add
+
+
+def add(a, b, chunk_digits=3, tier="So Big"):
+    out = io.StringIO()
+    digits = stream_add(io.BytesIO(a.encode()), io.BytesIO(b.encode()), out, tier, chunk_digits)
+    assert digits == len(out.getvalue())
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("a, b", [
+    ("0", "0"),
+    ("1", "2"),
+    ("999999", "1"),
+    ("1", "999999999"),
+    ("499999500", "500000500"),
+    ("12345678901234567890", "98765432109876543210"),
+    ("0000123", "0877"),
+    ("99999", "99999"),
+])
+def test_matches_int_addition(a, b):
+    assert add(a, b) == str(int(a) + int(b))
+
+
+def test_carry_through_many_chunks():
+    assert add("9" * 1000, "1", chunk_digits=7) == "1" + "0" * 1000
+
+
+def test_whitespace_between_digits():
+    assert add("12 34\n56\r\n", "4\n") == "123460"
+
+
+@pytest.mark.parametrize("a", ["", "12a", "-1", "1.5", " \n"])
+def test_invalid_input(a):
+    with pytest.raises(CalculationError):
+        add(a, "1")
+
+
+def test_requires_unlimited_tier():
+    with pytest.raises(CalculationError, match="权限错误"):
+        add("1", "1", tier="Ultra")
+
+
+def test_files_and_unseekable_stream(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("123456789" * 100)
+
+    class Pipe(io.RawIOBase):
+        def __init__(self, data):
+            self.data = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def readinto(self, buffer):
+            return self.data.readinto(buffer)
+
+    out = io.StringIO()
+    stream_add(str(path), io.BufferedReader(Pipe(b"1")), out, chunk_digits=50)
+    assert out.getvalue() == str(int("123456789" * 100) + 1)
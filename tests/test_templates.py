@@ -0,0 +1,32 @@
+from decimal import Decimal
+
+from calculator_engine import TEMPLATES, TRANSCRIPT_CACHE_MAX_CHARS, Line, DerivationTemplate, _cached_transcript, \
+    derivation_steps, get_backend, render_transcript
+
+
+def test_render_matches_steps():
+    for operator in TEMPLATES:
+        steps = derivation_steps(operator, 7.0, 2.5)
+        assert render_transcript(operator, 7.0, 2.5) == "".join(step.text + "\n" for step in steps)
+
+
+def test_static_lines_keep_braces():
+    template = DerivationTemplate([Line("π^{2k}"), Line("{a}+{b}", dynamic=True)])
+    assert template.render(a=1, b=2) == "π^{2k}\n1+2\n"
+
+
+def test_equal_values_with_different_text_are_not_shared():
+    backend = get_backend("decimal")
+    assert "1.0 + 1 = 2.0" in render_transcript("+", Decimal("1.0"), Decimal("1"), backend)
+    assert "1.00 + 1 = 2.00" in render_transcript("+", Decimal("1.00"), Decimal("1"), backend)
+
+
+def test_huge_operands_bypass_cache():
+    backend = get_backend("decimal")
+    huge = Decimal("9" * TRANSCRIPT_CACHE_MAX_CHARS)
+    before = _cached_transcript.cache_info().currsize
+
+    text = render_transcript("+", huge, Decimal(1), backend)
+
+    assert f"最终结论：{huge} + 1 = 1{'0' * TRANSCRIPT_CACHE_MAX_CHARS}" in text
+    assert _cached_transcript.cache_info().currsize == before
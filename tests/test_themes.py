@@ -0,0 +1,35 @@
+from calculator_core import VIP_LABEL_STYLES, ThemeManager
+
+
+def test_stylesheet_is_cached_per_theme():
+    themes = ThemeManager()
+    light = themes.get_stylesheet()
+    assert themes.get_stylesheet("light") is light
+    assert themes.get_stylesheet("dark") is not light
+    assert set(themes.stylesheets) == {"light", "dark"}
+
+
+def test_stylesheet_uses_theme_colours():
+    themes = ThemeManager()
+    for name, colours in themes.themes.items():
+        stylesheet = themes.get_stylesheet(name)
+        assert colours["window_bg"] in stylesheet and colours["title_color"] in stylesheet
+        assert "{" in stylesheet and "{{" not in stylesheet
+
+
+def test_stylesheet_covers_derivation_view():
+    # CalculationDialog 的推导文本使用 QPlainTextEdit
+    stylesheet = ThemeManager().get_stylesheet("dark")
+    assert "QTextEdit, QPlainTextEdit {" in stylesheet
+
+
+def test_unknown_theme_falls_back_to_light():
+    themes = ThemeManager()
+    assert themes.get_stylesheet("neon") is themes.get_stylesheet("light")
+    assert not themes.set_theme("neon") and themes.current_theme == "light"
+
+
+def test_vip_label_style():
+    themes = ThemeManager()
+    assert themes.get_vip_label_style("So Big") is VIP_LABEL_STYLES["So Big"]
+    assert themes.get_vip_label_style("Unknown") is VIP_LABEL_STYLES["Plus"]
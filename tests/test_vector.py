@@ -0,0 +1,46 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from calculator_vector import ERROR_INVALID, ERROR_OPERATOR, ERROR_PERMISSION, OK, OPERATION_DTYPE, evaluate_arrays, \
+    evaluate_records  # noqa: E402
+
+
+def test_single_operator():
+    result, errors = evaluate_arrays([1, 2, 20], [3, -4, 1], "-", "Plus")
+    np.testing.assert_array_equal(result[:2], [-2, 6])
+    assert np.isnan(result[2])
+    np.testing.assert_array_equal(errors, [OK, OK, ERROR_PERMISSION])
+
+
+def test_operator_column_and_invalid_operator():
+    result, errors = evaluate_arrays([1, 1, 1], [2, 2, 2], np.array(["+", "-", "*"]), "Plus")
+    np.testing.assert_array_equal(result[:2], [3, -1])
+    np.testing.assert_array_equal(errors, [OK, OK, ERROR_OPERATOR])
+
+
+def test_records_match_scalar_limits():
+    records = np.array([(b"+", -10, 10), (b"-", 10.5, 0)], dtype=OPERATION_DTYPE)
+    result, errors = evaluate_records(records, "Plus")
+    np.testing.assert_array_equal(errors, [OK, ERROR_PERMISSION])
+    assert result[0] == 0
+
+
+@pytest.mark.parametrize("tier", ["Plus", "So Big"])
+def test_non_finite_operands_rejected(tier):
+    a = [np.nan, 1, np.inf, 1, -np.inf, 20]
+    b = [1, np.nan, 1, -np.inf, np.nan, 1]
+    result, errors = evaluate_arrays(a, b, "+", tier)
+    assert np.isnan(result[:5]).all()
+    np.testing.assert_array_equal(errors[:5], [ERROR_INVALID] * 5)
+    assert errors[5] == (ERROR_PERMISSION if tier == "Plus" else OK)
+
+
+def test_invalid_operator_reported_before_non_finite():
+    result, errors = evaluate_arrays([np.nan, np.inf], [1, 1], np.array(["*", "+"]), "So Big")
+    np.testing.assert_array_equal(errors, [ERROR_OPERATOR, ERROR_INVALID])
+
+
+def test_shape_mismatch():
+    with pytest.raises(ValueError):
+        evaluate_arrays([1, 2], [1], "+")